@@ -1,16 +1,39 @@
 """The Frixos integration."""
 from __future__ import annotations
 
+from collections.abc import Iterable
 import logging
 from typing import Any
 
+import voluptuous as vol
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_PORT, Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.typing import ConfigType
 
-from .const import DOMAIN
+from .const import (
+    CONF_CONNECTION_LIMIT,
+    CONF_MAX_CONCURRENT_POLLS,
+    DATA_CONFIG,
+    DATA_SEEDS,
+    DEFAULT_CONNECTION_LIMIT,
+    DEFAULT_MAX_CONCURRENT_POLLS,
+    DOMAIN,
+    STORAGE_VERSION,
+)
 from .coordinator import FrixosDataUpdateCoordinator
+from .entity import FrixosValueSpec
+from .number import NUMBER_SPECS
+from .select import SELECT_SPECS
+from .sensor import SENSOR_SPECS
+from .services import async_setup_services
+from .session import async_close_session
+from .switch import SWITCH_SPECS
+from .text import TEXT_SPECS
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -22,6 +45,39 @@ PLATFORMS: list[Platform] = [
     Platform.TEXT,
 ]
 
+# Settings platforms only load if the device reports one of their values;
+# the sensor platform always loads for the coordinator diagnostics
+PLATFORM_SPECS: dict[Platform, Iterable[FrixosValueSpec]] = {
+    Platform.SWITCH: SWITCH_SPECS.values(),
+    Platform.NUMBER: NUMBER_SPECS.values(),
+    Platform.SELECT: SELECT_SPECS.values(),
+    Platform.TEXT: TEXT_SPECS.values(),
+}
+
+# Optional integration-wide settings shared by all devices
+CONFIG_SCHEMA = vol.Schema(
+    {
+        DOMAIN: vol.Schema(
+            {
+                vol.Optional(
+                    CONF_CONNECTION_LIMIT, default=DEFAULT_CONNECTION_LIMIT
+                ): cv.positive_int,
+                vol.Optional(
+                    CONF_MAX_CONCURRENT_POLLS, default=DEFAULT_MAX_CONCURRENT_POLLS
+                ): cv.positive_int,
+            }
+        )
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Frixos integration."""
+    hass.data.setdefault(DOMAIN, {})[DATA_CONFIG] = config.get(DOMAIN, {})
+    async_setup_services(hass)
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Frixos from a config entry."""
@@ -29,31 +85,83 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         hass,
         entry.data[CONF_HOST],
         entry.data[CONF_PORT],
+        entry.options,
+        entry.entry_id,
     )
 
-    # Fetch initial data so we have data when entities are added
-    try:
-        await coordinator.async_config_entry_first_refresh()
-    except Exception as err:
-        _LOGGER.error("Failed to connect to Frixos device: %s", err)
-        await coordinator.async_close()
-        raise ConfigEntryNotReady(f"Failed to connect: {err}") from err
-
+    # Start from the snapshot the config flow just fetched, or the one
+    # persisted before the last restart, so setup does not wait on the device
     hass.data.setdefault(DOMAIN, {})
+    seed = hass.data[DOMAIN].get(DATA_SEEDS, {}).pop(entry.unique_id, None)
+    refresh_in_background = False
+    if seed is not None:
+        coordinator.async_seed(seed, stale=False)
+    elif await coordinator.async_restore_snapshot():
+        refresh_in_background = True
+    else:
+        # Nothing cached yet: fetch initial data so entities have something to show
+        try:
+            await coordinator.async_config_entry_first_refresh()
+        except Exception as err:
+            _LOGGER.error("Failed to connect to Frixos device: %s", err)
+            await coordinator.async_close()
+            raise ConfigEntryNotReady(f"Failed to connect: {err}") from err
+
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
-    # Set up all platforms
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    # Set up only the platforms the device has values for
+    coordinator.platforms = supported_platforms(coordinator.data)
+    await hass.config_entries.async_forward_entry_setups(entry, coordinator.platforms)
+
+    if coordinator.lux_sampler is not None and SENSOR_SPECS["lux"].present(coordinator.data):
+        coordinator.lux_sampler.async_start()
+
+    if refresh_in_background:
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} first refresh {coordinator.host}"
+        )
+
+    # Reload when options change so the coordinator picks them up
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
     return True
 
 
+def supported_platforms(data: dict[str, Any] | None) -> list[Platform]:
+    """Return the platforms with at least one value present in data."""
+    return [
+        platform
+        for platform in PLATFORMS
+        if platform not in PLATFORM_SPECS
+        or any(spec.present(data) for spec in PLATFORM_SPECS[platform])
+    ]
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    unload_ok = await hass.config_entries.async_unload_platforms(
+        entry, coordinator.platforms
+    )
     if unload_ok:
-        coordinator = hass.data[DOMAIN][entry.entry_id]
         await coordinator.async_close()
         hass.data[DOMAIN].pop(entry.entry_id)
 
+        # Release the shared connection pool with the last device
+        if not any(
+            isinstance(value, FrixosDataUpdateCoordinator)
+            for value in hass.data[DOMAIN].values()
+        ):
+            await async_close_session(hass)
+
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the persisted snapshot of a deleted config entry."""
+    await Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}").async_remove()
+
+
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload a config entry after its options changed."""
+    await hass.config_entries.async_reload(entry.entry_id)
@@ -0,0 +1,90 @@
+"""Circuit breaker for unreachable Frixos devices."""
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from .const import (
+    BREAKER_BASE_BACKOFF,
+    BREAKER_CLOSED,
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_HALF_OPEN,
+    BREAKER_MAX_BACKOFF,
+    BREAKER_OPEN,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class FrixosCircuitBreaker:
+    """Track device reachability as a closed/open/half-open circuit breaker.
+
+    Closed: requests flow normally. After BREAKER_FAILURE_THRESHOLD
+    consecutive connection failures or timeouts (error responses and bad
+    payloads do not count) the breaker opens: writes fail fast and polls are
+    replaced by a single probe every backoff seconds. A probe runs in the
+    half-open state; success closes the breaker, failure reopens it with
+    the backoff doubled up to BREAKER_MAX_BACKOFF.
+    """
+
+    def __init__(self, host: str) -> None:
+        """Initialize a closed breaker."""
+        self.host = host
+        self.state = BREAKER_CLOSED
+        self.backoff: float = BREAKER_BASE_BACKOFF
+        # Number of times each state has been entered
+        self.transitions = {BREAKER_CLOSED: 0, BREAKER_OPEN: 0, BREAKER_HALF_OPEN: 0}
+        self._failures = 0
+
+    @property
+    def is_closed(self) -> bool:
+        """Return True if requests flow normally."""
+        return self.state == BREAKER_CLOSED
+
+    @property
+    def is_open(self) -> bool:
+        """Return True if requests should fail fast."""
+        return self.state == BREAKER_OPEN
+
+    def start_probe(self) -> None:
+        """Let one probe through an open breaker."""
+        if self.state == BREAKER_OPEN:
+            self._transition(BREAKER_HALF_OPEN)
+
+    def record_success(self) -> None:
+        """Record a successful request."""
+        self._failures = 0
+        if self.state != BREAKER_CLOSED:
+            _LOGGER.info("Frixos device %s is reachable again", self.host)
+            self.backoff = BREAKER_BASE_BACKOFF
+            self._transition(BREAKER_CLOSED)
+
+    def record_failure(self) -> None:
+        """Record a request that failed because the device was unreachable."""
+        if self.state == BREAKER_HALF_OPEN:
+            self.backoff = min(BREAKER_MAX_BACKOFF, self.backoff * 2)
+            self._transition(BREAKER_OPEN)
+            return
+        if self.state == BREAKER_CLOSED:
+            self._failures += 1
+            if self._failures >= BREAKER_FAILURE_THRESHOLD:
+                _LOGGER.warning(
+                    "Frixos device %s is unreachable, probing every %.0fs until it responds",
+                    self.host,
+                    self.backoff,
+                )
+                self._transition(BREAKER_OPEN)
+
+    def _transition(self, state: str) -> None:
+        """Enter a new state."""
+        self.state = state
+        self.transitions[state] += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the breaker state for diagnostics."""
+        return {
+            "state": self.state,
+            "consecutive_failures": self._failures,
+            "backoff": self.backoff,
+            "transitions": dict(self.transitions),
+        }
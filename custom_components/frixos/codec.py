@@ -0,0 +1,30 @@
+"""JSON codec for Frixos device payloads.
+
+orjson is used when it is installed (it ships with Home Assistant);
+otherwise the standard library json module is used.
+"""
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+CODEC_NAME = "orjson" if orjson is not None else "json"
+
+
+def json_loads(data: bytes | str) -> Any:
+    """Decode a JSON payload."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any) -> bytes:
+    """Encode an object as a UTF-8 JSON payload."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
@@ -61,35 +61,11 @@ class FrixosColor(FrixosEntity, ColorEntity):
             f"{coordinator.host}_{description.key}",
             description.name,
             description.icon,
+            (description.key,),
         )
         self.entity_description = description
         self._param_key = description.key
 
-    def _hex_to_rgb(self, hex_color: str) -> tuple[int, int, int] | None:
-        """Convert hex color string to RGB tuple."""
-        if not hex_color or not isinstance(hex_color, str):
-            return None
-        
-        # Remove # if present
-        hex_color = hex_color.lstrip("#")
-        
-        # Handle 3-digit hex (e.g., #F00 -> #FF0000)
-        if len(hex_color) == 3:
-            hex_color = "".join(c * 2 for c in hex_color)
-        
-        # Handle 6-digit hex
-        if len(hex_color) == 6:
-            try:
-                return (
-                    int(hex_color[0:2], 16),
-                    int(hex_color[2:4], 16),
-                    int(hex_color[4:6], 16),
-                )
-            except ValueError:
-                return None
-        
-        return None
-
     def _rgb_to_hex(self, rgb: tuple[int, int, int]) -> str:
         """Convert RGB tuple to hex color string."""
         return f"#{rgb[0]:02x}{rgb[1]:02x}{rgb[2]:02x}"
@@ -97,40 +73,7 @@ class FrixosColor(FrixosEntity, ColorEntity):
     @property
     def rgb_color(self) -> tuple[int, int, int] | None:
         """Return the rgb color value [0..255], [0..255], [0..255]."""
-        if not self.coordinator.data or not isinstance(self.coordinator.data, dict):
-            return None
-        
-        settings = self.coordinator.data.get("settings", {})
-        if not isinstance(settings, dict):
-            return None
-        
-        value = settings.get(self._param_key)
-        
-        if value is None:
-            return None
-        
-        # Handle different formats
-        if isinstance(value, str):
-            # Hex string format (e.g., "#FF0000" or "FF0000")
-            rgb = self._hex_to_rgb(value)
-            if rgb:
-                return rgb
-        elif isinstance(value, (list, tuple)) and len(value) == 3:
-            # RGB tuple/list format [r, g, b]
-            try:
-                return (int(value[0]), int(value[1]), int(value[2]))
-            except (ValueError, TypeError):
-                pass
-        elif isinstance(value, int):
-            # Integer format - might be a packed RGB value
-            # Try to interpret as 0xRRGGBB
-            hex_str = f"{value:06x}"
-            rgb = self._hex_to_rgb(hex_str)
-            if rgb:
-                return rgb
-        
-        # Default to white if we can't parse
-        return (255, 255, 255)
+        return self.coordinator.snapshot.rgb.get(self._param_key)
 
     async def async_turn_on(
         self,
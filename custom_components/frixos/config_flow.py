@@ -2,19 +2,55 @@
 from __future__ import annotations
 
 import asyncio
+import ipaddress
 import logging
+import re
 from typing import Any
 
 import aiohttp
 import voluptuous as vol
 
 from homeassistant import config_entries
+from homeassistant.components import network
 from homeassistant.const import CONF_HOST, CONF_NAME, CONF_PORT
-from homeassistant.core import HomeAssistant
-from homeassistant.data_entry_flow import FlowResult
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.data_entry_flow import FlowResult, FlowResultType
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.selector import TextSelector, TextSelectorConfig
 
-from .const import DOMAIN, DEFAULT_PORT, ENDPOINT_STATUS, DEFAULT_TIMEOUT
+from .codec import json_loads
+from .const import (
+    BULK_CONCURRENCY,
+    BULK_MAX_HOSTS,
+    CONF_DEVICE,
+    CONF_HOSTS,
+    CONF_LUX_SAMPLE_INTERVAL,
+    CONF_LUX_WINDOWS,
+    CONF_MAX_INTERVAL,
+    CONF_MIN_INTERVAL,
+    CONF_NETWORK,
+    CONF_READBACK_DELAY,
+    CONF_SETTINGS_INTERVAL,
+    CONF_SNAPSHOT,
+    CONF_STATUS_INTERVAL,
+    DOMAIN,
+    DEFAULT_LUX_SAMPLE_INTERVAL,
+    DEFAULT_LUX_WINDOWS,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MIN_SCAN_INTERVAL,
+    DEFAULT_PORT,
+    DEFAULT_READBACK_DELAY,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_SETTINGS_SCAN_INTERVAL,
+    DATA_SEEDS,
+    ENDPOINT_SETTINGS,
+    ENDPOINT_STATUS,
+    DEFAULT_TIMEOUT,
+    LUX_MIN_SAMPLE_INTERVAL,
+)
+from .discovery import FrixosDiscovery, async_scan_network
+from .sampler import parse_windows
+from .session import async_get_session
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -38,24 +74,65 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
     # Construct URL
     url = f"http://{host}:{port}{ENDPOINT_STATUS}"
 
-    async with aiohttp.ClientSession() as session:
-        try:
-            async with session.get(url, timeout=aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT)) as response:
-                if response.status == 200:
-                    result = await response.json()
-                    # Extract device info if available
-                    device_info = {
-                        "hostname": host,
-                        "app": result.get("app", "Frixos"),
-                        "version": result.get("version", "Unknown"),
-                    }
-                    return device_info
-                else:
-                    raise CannotConnect(f"Server returned status {response.status}")
-        except aiohttp.ClientError as err:
-            raise CannotConnect(f"Error connecting to device: {err}") from err
-        except asyncio.TimeoutError as err:
-            raise CannotConnect(f"Timeout connecting to device: {err}") from err
+    session = async_get_session(hass)
+    try:
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT)) as response:
+            if response.status == 200:
+                result = json_loads(await response.read())
+                # Extract device info if available
+                device_info = {
+                    "hostname": host,
+                    "app": result.get("app", "Frixos"),
+                    "version": result.get("version", "Unknown"),
+                }
+            else:
+                raise CannotConnect(f"Server returned status {response.status}")
+    except aiohttp.ClientError as err:
+        raise CannotConnect(f"Error connecting to device: {err}") from err
+    except asyncio.TimeoutError as err:
+        raise CannotConnect(f"Timeout connecting to device: {err}") from err
+
+    # Fetch settings too so the new entry can start from this snapshot
+    # instead of polling the device again during setup
+    try:
+        async with session.get(
+            f"http://{host}:{port}{ENDPOINT_SETTINGS}",
+            timeout=aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT),
+        ) as response:
+            if response.status == 200:
+                settings = json_loads(await response.read())
+                if isinstance(settings, dict) and isinstance(result, dict):
+                    device_info["snapshot"] = {"settings": settings, "status": result}
+    except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as err:
+        _LOGGER.debug("Could not fetch settings from %s: %s", host, err)
+
+    return device_info
+
+
+def parse_host_list(text: str, default_port: int) -> list[tuple[str, int]]:
+    """Parse hosts separated by newlines, commas or spaces.
+
+    Each host may carry its own port (host:port, or [address]:port for
+    IPv6). Raises ValueError on a malformed entry or too many hosts.
+    """
+    hosts = []
+    for token in re.split(r"[\s,;]+", text.strip()):
+        if not token:
+            continue
+        host, port = token, default_port
+        if token.startswith("["):
+            host, _, rest = token[1:].partition("]")
+            if rest:
+                port = int(rest.removeprefix(":"))
+        elif token.count(":") == 1:
+            host, port_text = token.split(":")
+            port = int(port_text)
+        if not host or not 0 < port < 65536:
+            raise ValueError(f"Invalid host: {token}")
+        hosts.append((host, port))
+    if not hosts or len(hosts) > BULK_MAX_HOSTS:
+        raise ValueError(f"Expected 1 to {BULK_MAX_HOSTS} hosts")
+    return hosts
 
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -63,13 +140,33 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> OptionsFlowHandler:
+        """Get the options flow for this handler."""
+        return OptionsFlowHandler(config_entry)
+
+    def __init__(self) -> None:
+        """Initialize the flow."""
+        self._discovered: dict[str, FrixosDiscovery] = {}
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Handle the initial step."""
+        return self.async_show_menu(
+            step_id="user", menu_options=["discover", "manual", "bulk"]
+        )
+
+    async def async_step_manual(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Add a device by host name or IP address."""
         if user_input is None:
             return self.async_show_form(
-                step_id="user", data_schema=STEP_USER_DATA_SCHEMA
+                step_id="manual", data_schema=STEP_USER_DATA_SCHEMA
             )
 
         errors = {}
@@ -82,23 +179,290 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             _LOGGER.exception("Unexpected exception")
             errors["base"] = "unknown"
         else:
-            # Use hostname as unique_id if available, otherwise use host:port
-            unique_id = f"{user_input[CONF_HOST]}:{user_input.get(CONF_PORT, DEFAULT_PORT)}"
-            
-            await self.async_set_unique_id(unique_id)
-            self._abort_if_unique_id_configured()
-
-            return self.async_create_entry(
-                title=user_input.get(CONF_NAME, info.get("app", "Frixos")),
-                data={
-                    CONF_HOST: user_input[CONF_HOST],
-                    CONF_PORT: user_input.get(CONF_PORT, DEFAULT_PORT),
-                    CONF_NAME: user_input.get(CONF_NAME, info.get("app", "Frixos")),
-                },
+            return await self._async_create_device_entry(user_input, info)
+
+        return self.async_show_form(
+            step_id="manual", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
+        )
+
+    async def async_step_discover(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Scan a network for Frixos devices."""
+        errors = {}
+
+        if user_input is not None:
+            try:
+                devices = await async_scan_network(
+                    async_get_session(self.hass),
+                    user_input[CONF_NETWORK],
+                    user_input[CONF_PORT],
+                    skip=self._async_current_ids(),
+                )
+            except ValueError:
+                errors[CONF_NETWORK] = "invalid_network"
+            else:
+                if devices:
+                    self._discovered = {device.unique_id: device for device in devices}
+                    return await self.async_step_pick()
+                errors["base"] = "no_devices_found"
+
+        if user_input is None:
+            user_input = {
+                CONF_NETWORK: await self._async_default_network(),
+                CONF_PORT: DEFAULT_PORT,
+            }
+        return self.async_show_form(
+            step_id="discover",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_NETWORK, default=user_input[CONF_NETWORK]): str,
+                    vol.Optional(CONF_PORT, default=user_input[CONF_PORT]): int,
+                }
+            ),
+            errors=errors,
+        )
+
+    async def async_step_pick(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Choose one of the devices found by the scan."""
+        errors = {}
+
+        if user_input is not None:
+            device = self._discovered[user_input[CONF_DEVICE]]
+            device_input = {
+                CONF_HOST: device.host,
+                CONF_PORT: device.port,
+                CONF_NAME: user_input.get(CONF_NAME, "Frixos"),
+            }
+            try:
+                info = await validate_input(self.hass, device_input)
+            except CannotConnect:
+                errors["base"] = "cannot_connect"
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Unexpected exception")
+                errors["base"] = "unknown"
+            else:
+                return await self._async_create_device_entry(device_input, info)
+
+        return self.async_show_form(
+            step_id="pick",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_DEVICE): vol.In(
+                        {
+                            unique_id: f"{device.app} {device.version} ({unique_id})"
+                            for unique_id, device in self._discovered.items()
+                        }
+                    ),
+                    vol.Optional(CONF_NAME, default="Frixos"): str,
+                }
+            ),
+            errors=errors,
+        )
+
+    async def async_step_bulk(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Add many devices at once from a list of hosts."""
+        errors = {}
+
+        if user_input is not None:
+            try:
+                hosts = parse_host_list(user_input[CONF_HOSTS], user_input[CONF_PORT])
+            except ValueError:
+                errors[CONF_HOSTS] = "invalid_hosts"
+            else:
+                report = await self._async_add_hosts(hosts)
+                return self.async_abort(
+                    reason="bulk_done",
+                    description_placeholders={"report": "\n".join(report)},
+                )
+
+        return self.async_show_form(
+            step_id="bulk",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_HOSTS): TextSelector(
+                        TextSelectorConfig(multiline=True)
+                    ),
+                    vol.Optional(CONF_PORT, default=DEFAULT_PORT): int,
+                }
+            ),
+            errors=errors,
+        )
+
+    async def async_step_import(self, import_data: dict[str, Any]) -> FlowResult:
+        """Create an entry for a device validated by the bulk step."""
+        info = {}
+        if (snapshot := import_data.get(CONF_SNAPSHOT)) is not None:
+            info["snapshot"] = snapshot
+        return await self._async_create_device_entry(import_data, info)
+
+    async def _async_add_hosts(self, hosts: list[tuple[str, int]]) -> list[str]:
+        """Validate hosts concurrently and start an entry for each one reachable.
+
+        Returns one report line per host, in the order given.
+        """
+        configured = self._async_current_ids()
+        semaphore = asyncio.Semaphore(BULK_CONCURRENCY)
+
+        async def validate(host: str, port: int) -> dict[str, Any]:
+            async with semaphore:
+                return await validate_input(self.hass, {CONF_HOST: host, CONF_PORT: port})
+
+        pending: dict[str, tuple[str, int]] = {}
+        for host, port in hosts:
+            unique_id = f"{host}:{port}"
+            if unique_id not in configured:
+                pending.setdefault(unique_id, (host, port))
+
+        # All validations share the integration's session
+        results = await asyncio.gather(
+            *(validate(host, port) for host, port in pending.values()),
+            return_exceptions=True,
+        )
+        outcome = dict(zip(pending, results))
+
+        report = []
+        seen: set[str] = set()
+        for host, port in hosts:
+            unique_id = f"{host}:{port}"
+            if unique_id in seen:
+                report.append(f"{unique_id}: duplicate, skipped")
+                continue
+            seen.add(unique_id)
+            if unique_id in configured:
+                report.append(f"{unique_id}: already configured")
+                continue
+
+            info = outcome[unique_id]
+            if isinstance(info, CannotConnect):
+                report.append(f"{unique_id}: cannot connect")
+                continue
+            if isinstance(info, Exception):
+                _LOGGER.error("Unexpected error validating %s: %s", unique_id, info)
+                report.append(f"{unique_id}: unexpected error")
+                continue
+
+            data = {
+                CONF_HOST: host,
+                CONF_PORT: port,
+                CONF_NAME: f"{info.get('app', 'Frixos')} {host}",
+            }
+            # Seeded by the import flow only once it is about to create the
+            # entry, so an aborted import leaves nothing behind
+            if "snapshot" in info:
+                data[CONF_SNAPSHOT] = info["snapshot"]
+            result = await self.hass.config_entries.flow.async_init(
+                DOMAIN,
+                context={"source": config_entries.SOURCE_IMPORT},
+                data=data,
             )
+            if result["type"] == FlowResultType.CREATE_ENTRY:
+                report.append(f"{unique_id}: added")
+            else:
+                report.append(f"{unique_id}: {result.get('reason', 'not added')}")
+        return report
+
+    async def _async_default_network(self) -> str:
+        """Guess the /24 network Home Assistant itself is on."""
+        try:
+            source_ip = await network.async_get_source_ip(self.hass)
+            return str(ipaddress.ip_network(f"{source_ip}/24", strict=False))
+        except (HomeAssistantError, ValueError):
+            return ""
+
+    async def _async_create_device_entry(
+        self, user_input: dict[str, Any], info: dict[str, Any]
+    ) -> FlowResult:
+        """Create the entry for a validated device."""
+        # Use hostname as unique_id if available, otherwise use host:port
+        unique_id = f"{user_input[CONF_HOST]}:{user_input.get(CONF_PORT, DEFAULT_PORT)}"
+
+        await self.async_set_unique_id(unique_id)
+        self._abort_if_unique_id_configured()
+
+        # Consumed by the entry setup that creating the entry starts
+        if "snapshot" in info:
+            self.hass.data.setdefault(DOMAIN, {}).setdefault(DATA_SEEDS, {})[
+                unique_id
+            ] = info["snapshot"]
+
+        return self.async_create_entry(
+            title=user_input.get(CONF_NAME, info.get("app", "Frixos")),
+            data={
+                CONF_HOST: user_input[CONF_HOST],
+                CONF_PORT: user_input.get(CONF_PORT, DEFAULT_PORT),
+                CONF_NAME: user_input.get(CONF_NAME, info.get("app", "Frixos")),
+            },
+        )
+
+
+class OptionsFlowHandler(config_entries.OptionsFlow):
+    """Handle Frixos options."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize options flow."""
+        self._entry = config_entry
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the polling and write options."""
+        errors: dict[str, str] = {}
+        if user_input is not None:
+            sample_interval = user_input.get(CONF_LUX_SAMPLE_INTERVAL, 0)
+            if 0 < sample_interval < LUX_MIN_SAMPLE_INTERVAL:
+                errors[CONF_LUX_SAMPLE_INTERVAL] = "invalid_lux_sample_interval"
+            try:
+                parse_windows(user_input.get(CONF_LUX_WINDOWS, DEFAULT_LUX_WINDOWS))
+            except ValueError:
+                errors[CONF_LUX_WINDOWS] = "invalid_lux_windows"
+            if not errors:
+                return self.async_create_entry(title="", data=user_input)
 
+        options = {**self._entry.options, **(user_input or {})}
         return self.async_show_form(
-            step_id="user", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_STATUS_INTERVAL,
+                        default=options.get(CONF_STATUS_INTERVAL, DEFAULT_SCAN_INTERVAL),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=5, max=3600)),
+                    vol.Optional(
+                        CONF_SETTINGS_INTERVAL,
+                        default=options.get(
+                            CONF_SETTINGS_INTERVAL, DEFAULT_SETTINGS_SCAN_INTERVAL
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=30, max=86400)),
+                    vol.Optional(
+                        CONF_MIN_INTERVAL,
+                        default=options.get(CONF_MIN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=5, max=3600)),
+                    vol.Optional(
+                        CONF_MAX_INTERVAL,
+                        default=options.get(CONF_MAX_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=5, max=86400)),
+                    vol.Optional(
+                        CONF_READBACK_DELAY,
+                        default=options.get(CONF_READBACK_DELAY, DEFAULT_READBACK_DELAY),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0, max=60)),
+                    vol.Optional(
+                        CONF_LUX_SAMPLE_INTERVAL,
+                        default=options.get(
+                            CONF_LUX_SAMPLE_INTERVAL, DEFAULT_LUX_SAMPLE_INTERVAL
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=3600)),
+                    vol.Optional(
+                        CONF_LUX_WINDOWS,
+                        default=options.get(CONF_LUX_WINDOWS, DEFAULT_LUX_WINDOWS),
+                    ): str,
+                }
+            ),
+            errors=errors,
         )
 
 
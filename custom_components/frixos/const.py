@@ -2,9 +2,105 @@
 from typing import Final
 
 DOMAIN: Final = "frixos"
-DEFAULT_SCAN_INTERVAL: Final = 60  # seconds
+DEFAULT_SCAN_INTERVAL: Final = 60  # seconds, status poll
+DEFAULT_SETTINGS_SCAN_INTERVAL: Final = 300  # seconds
+DEFAULT_MIN_SCAN_INTERVAL: Final = 15  # seconds, adaptive polling floor
+DEFAULT_MAX_SCAN_INTERVAL: Final = 600  # seconds, adaptive polling ceiling
+SCAN_INTERVAL_BACKOFF: Final = 1.5  # factor applied per idle or failed poll
+# Light level changes within sensor noise do not count as activity
+LUX_ACTIVITY_MIN_CHANGE: Final = 5.0  # lux
+LUX_ACTIVITY_MIN_RATIO: Final = 0.1  # of the previous light level
 DEFAULT_TIMEOUT: Final = 10  # seconds
 DEFAULT_PORT: Final = 80
+DEFAULT_CONNECTION_LIMIT: Final = 100  # total connections across all devices
+CONNECTION_KEEPALIVE: Final = 15  # seconds an idle device connection is kept
+DNS_CACHE_TTL: Final = 300  # seconds
+DEFAULT_MAX_CONCURRENT_POLLS: Final = 8  # device polls in flight fleet-wide
+POLL_SLOT_TOLERANCE: Final = 1.0  # seconds, Home Assistant timers fire on whole seconds
+
+# Circuit breaker for unreachable devices
+BREAKER_CLOSED: Final = "closed"
+BREAKER_OPEN: Final = "open"
+BREAKER_HALF_OPEN: Final = "half_open"
+BREAKER_FAILURE_THRESHOLD: Final = 3  # consecutive failed polls before opening
+BREAKER_BASE_BACKOFF: Final = 30  # seconds between probes once open
+BREAKER_MAX_BACKOFF: Final = 900  # seconds
+BREAKER_PROBE_TIMEOUT: Final = 3  # seconds
+
+# Request metrics
+LATENCY_BUCKETS_MS: Final = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+METRICS_DECAY_SAMPLES: Final = 1000  # halve counts after this many samples
+DIAGNOSTICS_RECENT_SAMPLES: Final = 20  # latest durations kept per endpoint
+
+# Request lane priorities, lowest runs first
+PRIORITY_WRITE: Final = 0
+PRIORITY_REFRESH: Final = 1
+PRIORITY_POLL: Final = 2
+
+WRITE_BATCH_WINDOW: Final = 0.05  # seconds to collect writes into one POST
+DEFAULT_READBACK_DELAY: Final = 0  # seconds, 0 = confirm on next scheduled poll
+
+# Scrolling message service
+MESSAGE_MAX_BYTES: Final = 511  # device buffer for p16, in UTF-8 bytes
+MESSAGE_MIN_INTERVAL: Final = 2  # seconds between message writes to one device
+MESSAGE_QUEUE_SIZE: Final = 10  # messages waiting per device before dropping
+
+# Settings broadcast service
+BROADCAST_CONCURRENCY: Final = 16  # devices written at once
+BROADCAST_ATTEMPTS: Final = 3  # tries per device, failures only
+BROADCAST_RETRY_DELAY: Final = 1  # seconds before retrying failed devices
+
+# LAN discovery scan
+DISCOVERY_CONCURRENCY: Final = 64  # addresses probed at once
+DISCOVERY_CONNECT_TIMEOUT: Final = 0.5  # seconds, most addresses have no host
+DISCOVERY_TIMEOUT: Final = 2  # seconds per probe, including the response
+DISCOVERY_DEADLINE: Final = 15  # seconds for the whole scan
+DISCOVERY_MAX_HOSTS: Final = 1024  # refuse to scan larger networks
+DISCOVERY_MAX_BODY: Final = 64 * 1024  # bytes, skips web servers that are not a Frixos
+
+# Bulk onboarding
+BULK_CONCURRENCY: Final = 16  # hosts validated at once
+BULK_MAX_HOSTS: Final = 256
+
+# Light level sampler
+DEFAULT_LUX_SAMPLE_INTERVAL: Final = 0  # seconds between status-only samples, 0 = off
+DEFAULT_LUX_WINDOWS: Final = "60, 300, 900"  # seconds each statistic covers
+LUX_MIN_SAMPLE_INTERVAL: Final = 2  # seconds
+LUX_MIN_WINDOW: Final = 10  # seconds
+LUX_MAX_WINDOW: Final = 3600  # seconds, bounds the sample buffer
+LUX_MAX_WINDOWS: Final = 4
+LUX_PUBLISH_INTERVAL: Final = 10  # seconds between state writes of the statistics
+
+# Last known device snapshot persisted across restarts
+STORAGE_VERSION: Final = 1
+SNAPSHOT_SAVE_DELAY: Final = 300  # seconds, coalesces writes to .storage
+
+# hass.data[DOMAIN] keys shared by all config entries
+DATA_CONFIG: Final = "config"
+DATA_SCHEDULER: Final = "scheduler"
+DATA_PRESETS: Final = "presets"
+DATA_SEEDS: Final = "seeds"
+DATA_SESSION: Final = "session"
+DATA_SESSION_UNSUB: Final = "session_unsub"
+
+# YAML configuration
+CONF_CONNECTION_LIMIT: Final = "connection_limit"
+CONF_MAX_CONCURRENT_POLLS: Final = "max_concurrent_polls"
+
+# Config flow
+CONF_DEVICE: Final = "device"
+CONF_HOSTS: Final = "hosts"
+CONF_NETWORK: Final = "network"
+CONF_SNAPSHOT: Final = "snapshot"  # import flow data only, never stored
+
+# Options
+CONF_READBACK_DELAY: Final = "readback_delay"
+CONF_STATUS_INTERVAL: Final = "status_interval"
+CONF_SETTINGS_INTERVAL: Final = "settings_interval"
+CONF_MIN_INTERVAL: Final = "min_interval"
+CONF_MAX_INTERVAL: Final = "max_interval"
+CONF_LUX_SAMPLE_INTERVAL: Final = "lux_sample_interval"
+CONF_LUX_WINDOWS: Final = "lux_windows"
 
 # API endpoints
 ENDPOINT_SETTINGS: Final = "/api/settings"
@@ -127,6 +223,20 @@ RESTART_REQUIRED_PARAMS = {
     PARAM_TIMEZONE,
 }
 
+# Credentials that must never appear in diagnostics or logs
+SECRET_PARAMS = {
+    PARAM_HA_TOKEN,
+    PARAM_STOCK_KEY,
+    PARAM_DEXCOM_PASSWORD,
+    PARAM_WIFI_PASS,
+}
+
+# Hex color parameters, compared case-insensitively
+COLOR_PARAMS = {
+    PARAM_MSG_COLOR,
+    PARAM_NIGHT_MSG_COLOR,
+}
+
 # Password fields (should be masked in config flow)
 PASSWORD_PARAMS = {
     PARAM_WIFI_PASS,
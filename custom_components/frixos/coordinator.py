@@ -2,19 +2,111 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import logging
+import time
+from collections.abc import Callable, Mapping
 from datetime import timedelta
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import aiohttp
+from aiohttp import hdrs
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DOMAIN, ENDPOINT_SETTINGS, ENDPOINT_STATUS, DEFAULT_SCAN_INTERVAL
+from .breaker import FrixosCircuitBreaker
+from .codec import json_dumps, json_loads
+from .const import (
+    BREAKER_PROBE_TIMEOUT,
+    CONF_LUX_SAMPLE_INTERVAL,
+    CONF_LUX_WINDOWS,
+    CONF_MAX_INTERVAL,
+    CONF_MIN_INTERVAL,
+    CONF_READBACK_DELAY,
+    CONF_SETTINGS_INTERVAL,
+    CONF_STATUS_INTERVAL,
+    DOMAIN,
+    ENDPOINT_SETTINGS,
+    ENDPOINT_STATUS,
+    DEFAULT_LUX_SAMPLE_INTERVAL,
+    DEFAULT_LUX_WINDOWS,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MIN_SCAN_INTERVAL,
+    DEFAULT_READBACK_DELAY,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_SETTINGS_SCAN_INTERVAL,
+    DEFAULT_TIMEOUT,
+    LUX_ACTIVITY_MIN_CHANGE,
+    LUX_ACTIVITY_MIN_RATIO,
+    PRIORITY_POLL,
+    PRIORITY_REFRESH,
+    PRIORITY_WRITE,
+    SCAN_INTERVAL_BACKOFF,
+    SECRET_PARAMS,
+    SNAPSHOT_SAVE_DELAY,
+    STORAGE_VERSION,
+    WRITE_BATCH_WINDOW,
+)
+from .lane import FrixosRequestLane
+from .messages import FrixosMessageQueue
+from .metrics import FrixosMetrics
+from .sampler import FrixosLuxSampler, parse_windows
+from .scheduler import async_get_scheduler
+from .session import async_get_session
+from .snapshot import FrixosSnapshot
+from .values import values_equal
+
+if TYPE_CHECKING:
+    from .entity import FrixosValueSpec
 
 _LOGGER = logging.getLogger(__name__)
 
+_MISSING = object()
+
+
+class DeviceUnreachable(UpdateFailed):
+    """Error to indicate the device did not answer at all.
+
+    Only these failures count towards the circuit breaker; an error status
+    or an unreadable payload still proves the device is reachable.
+    """
+
+
+def _lux_moved(old: Any, new: Any) -> bool:
+    """Return True if the light level changed by more than sensor noise."""
+    try:
+        before, after = float(old), float(new)
+    except (TypeError, ValueError):
+        return old != new
+    return abs(after - before) > max(LUX_ACTIVITY_MIN_CHANGE, LUX_ACTIVITY_MIN_RATIO * abs(before))
+
+
+class _PayloadCache:
+    """Last body digest, ETag and decoded object of one endpoint."""
+
+    __slots__ = ("digest", "etag", "data", "hits", "misses", "size", "decode_ms", "fetched_at")
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        self.digest: bytes | None = None
+        self.etag: str | None = None
+        self.data: dict | None = None
+        self.hits = 0
+        self.misses = 0
+        # Size and decode time of the last body, monotonic time of last success
+        self.size: int | None = None
+        self.decode_ms: float | None = None
+        self.fetched_at: float | None = None
+
+    def invalidate(self) -> None:
+        """Force the next response to be decoded."""
+        self.digest = None
+        self.etag = None
+
 
 class FrixosDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching Frixos data."""
@@ -24,133 +116,735 @@ class FrixosDataUpdateCoordinator(DataUpdateCoordinator):
         hass: HomeAssistant,
         host: str,
         port: int,
+        options: Mapping[str, Any] | None = None,
+        entry_id: str | None = None,
     ) -> None:
         """Initialize."""
+        options = options or {}
         self.host = host
         self.port = port
         self.base_url = f"http://{host}:{port}"
         self._session: aiohttp.ClientSession | None = None
+        self._scheduler = async_get_scheduler(hass)
+        # Writes queued for the next batched POST (last writer wins per key)
+        self._pending_writes: dict[str, Any] = {}
+        self._pending_results: list[asyncio.Future[bool]] = []
+        # Batches being posted, oldest first, until the device answered
+        self._inflight_writes: list[dict[str, Any]] = []
+        self._flush_unsub: CALLBACK_TYPE | None = None
+        self._readback_delay: float = options.get(CONF_READBACK_DELAY, DEFAULT_READBACK_DELAY)
+        self._readback_unsub: CALLBACK_TYPE | None = None
+        # Settings change rarely, so they are polled on a slower schedule
+        self._settings_interval: float = options.get(
+            CONF_SETTINGS_INTERVAL, DEFAULT_SETTINGS_SCAN_INTERVAL
+        )
+        self._settings_fetched_at: float | None = None
+        self._settings_stale = True
+        # Bumped per acknowledged write, so older settings reads are not kept
+        self._write_generation = 0
+        # Adaptive polling: back off while idle or unreachable, tighten on activity
+        self._min_interval: float = options.get(CONF_MIN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL)
+        self._max_interval: float = max(
+            self._min_interval, options.get(CONF_MAX_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL)
+        )
+        self._poll_interval: float = min(
+            self._max_interval,
+            max(self._min_interval, options.get(CONF_STATUS_INTERVAL, DEFAULT_SCAN_INTERVAL)),
+        )
+
+        self.metrics = FrixosMetrics()
+        self.breaker = FrixosCircuitBreaker(host)
+        # All requests to the device go through one prioritized lane
+        self.lane = FrixosRequestLane()
+        self._refresh_priority = PRIORITY_POLL
+        self.messages = FrixosMessageQueue(self)
+        # Optional fast light level sampling between polls, started by setup
+        sample_interval = options.get(CONF_LUX_SAMPLE_INTERVAL, DEFAULT_LUX_SAMPLE_INTERVAL)
+        self.lux_sampler: FrixosLuxSampler | None = (
+            FrixosLuxSampler(
+                self,
+                sample_interval,
+                parse_windows(options.get(CONF_LUX_WINDOWS, DEFAULT_LUX_WINDOWS)),
+            )
+            if sample_interval
+            else None
+        )
+        self._payload_cache = {
+            ENDPOINT_SETTINGS: _PayloadCache(),
+            ENDPOINT_STATUS: _PayloadCache(),
+        }
+        # Per-key listener index and the snapshot listeners were last notified of
+        self._key_listeners: dict[str | None, dict[CALLBACK_TYPE, None]] = {}
+        self._notified: dict[str, dict[str, Any]] | None = None
+        self._notified_success: bool | None = None
+        self._notified_stale: bool | None = None
+
+        # Last known snapshot, served (marked stale) until the first live poll
+        self._store: Store | None = None
+        if entry_id is not None:
+            self._store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}")
+        self.stale = False
+        # When the delayed save already scheduled is due to write
+        self._save_due: float | None = None
+
+        # Platforms set up for this device, chosen from its first snapshot
+        self.platforms: list[str] = []
+
+        # Values the entities read, converted once per data change
+        self._specs: dict[str, list[FrixosValueSpec]] = {}
+        self.snapshot = FrixosSnapshot(None, {})
+        self._device_info: DeviceInfo | None = None
 
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+            update_interval=timedelta(seconds=self._poll_interval),
         )
 
+    @property
+    def poll_interval(self) -> float:
+        """Return the current adaptive status poll interval in seconds."""
+        return self._poll_interval
+
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> Callable[[], None]:
+        """Listen for data updates, indexed by the keys in a frozenset context.
+
+        Listeners without a key context are notified on every update.
+        """
+        remove_listener = super().async_add_listener(update_callback, context)
+        keys = context if isinstance(context, frozenset) else (None,)
+        for key in keys:
+            self._key_listeners.setdefault(key, {})[update_callback] = None
+
+        @callback
+        def remove_key_listener() -> None:
+            """Remove update listener."""
+            remove_listener()
+            for key in keys:
+                self._key_listeners.get(key, {}).pop(update_callback, None)
+
+        return remove_key_listener
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify only the listeners whose keys changed since the last update."""
+        changed = self._async_changed_keys()
+        if changed is None or changed:
+            self.snapshot = FrixosSnapshot(self.data, self._specs, self.snapshot, changed)
+        if changed is None:
+            super().async_update_listeners()
+            return
+
+        callbacks = dict(self._key_listeners.get(None, {}))
+        for key in changed:
+            callbacks.update(self._key_listeners.get(key, {}))
+        for update_callback in callbacks:
+            update_callback()
+
+    @callback
+    def _async_changed_keys(self) -> set[str] | None:
+        """Diff the data against the last notified snapshot.
+
+        Returns None when every listener must update: on the first data,
+        or when availability or staleness flipped.
+        """
+        data = self.data if isinstance(self.data, dict) else {}
+        previous = self._notified
+        self._notified = {
+            section: dict(data.get(section) or {}) for section in ("settings", "status")
+        }
+        success_changed = self._notified_success != self.last_update_success
+        self._notified_success = self.last_update_success
+        stale_changed = self._notified_stale != self.stale
+        self._notified_stale = self.stale
+        if previous is None or success_changed or stale_changed:
+            return None
+
+        changed: set[str] = set()
+        for section, new in self._notified.items():
+            old = previous[section]
+            changed.update(
+                key for key in old.keys() | new.keys()
+                if old.get(key, _MISSING) != new.get(key, _MISSING)
+            )
+        return changed
+
+    @callback
+    def async_track_spec(self, spec: FrixosValueSpec) -> CALLBACK_TYPE:
+        """Convert the value of spec in every snapshot until untracked."""
+        self._specs.setdefault(spec.param, []).append(spec)
+        self.snapshot.add(spec)
+
+        @callback
+        def untrack_spec() -> None:
+            """Stop converting the value of spec."""
+            specs = self._specs[spec.param]
+            specs.remove(spec)
+            if not specs:
+                del self._specs[spec.param]
+
+        return untrack_spec
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return device information, rebuilt only when the firmware changes."""
+        version = self.snapshot.version
+        if self._device_info is None or self._device_info["sw_version"] != version:
+            self._device_info = DeviceInfo(
+                identifiers={(DOMAIN, self.host)},
+                name=self.host,
+                manufacturer="Frixos",
+                model="Frixos Device",
+                sw_version=version,
+            )
+        return self._device_info
+
+    async def async_refresh(self) -> None:
+        """Refresh data on demand, ahead of scheduled polls on the lane."""
+        self._refresh_priority = PRIORITY_REFRESH
+        try:
+            await super().async_refresh()
+        finally:
+            self._refresh_priority = PRIORITY_POLL
+
     async def _async_create_session(self) -> None:
-        """Create aiohttp session if it doesn't exist."""
-        if self._session is None:
-            self._session = aiohttp.ClientSession()
+        """Attach to the integration's shared aiohttp session."""
+        if self._session is None or self._session.closed:
+            self._session = async_get_session(self.hass)
 
     async def _async_update_data(self) -> dict:
-        """Fetch data from Frixos device."""
+        """Fetch data from Frixos device and adapt the poll interval."""
+        # An unreachable device only gets a single cheap probe per poll
+        probe = not self.breaker.is_closed
+        self.breaker.start_probe()
+        poll_started = time.time()
+        try:
+            # Bound the number of devices polled at once across the fleet
+            async with self._scheduler.semaphore:
+                started = time.perf_counter()
+                data = await self._async_fetch_data(probe)
+                self.metrics.record_latency("poll", time.perf_counter() - started)
+        except DeviceUnreachable:
+            self.breaker.record_failure()
+            self._async_adapt_interval(False, poll_started)
+            raise
+        except UpdateFailed:
+            # The device answered, just not with usable data
+            self.breaker.record_success()
+            self._async_adapt_interval(False, poll_started)
+            raise
+
+        self.breaker.record_success()
+        self._async_adapt_interval(probe or self._has_activity(data), poll_started)
+        self.stale = False
+        self._async_schedule_save()
+        return data
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Schedule a delayed snapshot save unless one is already pending.
+
+        Store.async_delay_save restarts its timer on every call, so calling
+        it on each poll faster than the delay would postpone the save until
+        shutdown; the pending save writes the latest data when it fires.
+        """
+        if self._store is None:
+            return
+        now = time.monotonic()
+        if self._save_due is None or now >= self._save_due:
+            self._save_due = now + SNAPSHOT_SAVE_DELAY
+            self._store.async_delay_save(self._snapshot_to_save, SNAPSHOT_SAVE_DELAY)
+
+    async def async_restore_snapshot(self) -> bool:
+        """Load the persisted snapshot as stale data, returning True if found."""
+        if self._store is None:
+            return False
+        try:
+            data = await self._store.async_load()
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.warning("Could not load cached snapshot for %s: %s", self.host, err)
+            return False
+        if (
+            not isinstance(data, dict)
+            or not isinstance(data.get("settings"), dict)
+            or not isinstance(data.get("status"), dict)
+        ):
+            return False
+        self.async_seed(data, stale=True)
+        return True
+
+    @callback
+    def async_seed(self, data: dict, stale: bool) -> None:
+        """Use a snapshot obtained outside of a poll as the current data."""
+        self.stale = stale
+        if not stale:
+            self._settings_fetched_at = time.monotonic()
+            self._settings_stale = False
+        self.async_set_updated_data(data)
+
+    def _snapshot_to_save(self) -> dict:
+        """Return the data to persist, without secrets."""
+        data = self.data if isinstance(self.data, dict) else {}
+        return {
+            "settings": {
+                key: value
+                for key, value in (data.get("settings") or {}).items()
+                if key not in SECRET_PARAMS
+            },
+            "status": data.get("status") or {},
+        }
+
+    def _has_activity(self, data: dict) -> bool:
+        """Return True if the light level or settings changed since last poll."""
+        if not isinstance(self.data, dict):
+            return True
+        old_status = self.data.get("status") or {}
+        return (
+            _lux_moved(old_status.get("lux"), data["status"].get("lux"))
+            or data["settings"] != self.data.get("settings")
+        )
+
+    @callback
+    def _async_adapt_interval(self, active: bool, started: float) -> None:
+        """Tighten the poll interval on activity, back off geometrically otherwise."""
+        if self.breaker.is_open:
+            # Probe on the breaker's own exponential backoff
+            self.update_interval = timedelta(seconds=self.breaker.backoff)
+            return
+
+        if active:
+            interval = max(self._min_interval, self._poll_interval / SCAN_INTERVAL_BACKOFF)
+        else:
+            interval = min(self._max_interval, self._poll_interval * SCAN_INTERVAL_BACKOFF)
+
+        if interval != self._poll_interval:
+            _LOGGER.debug("Poll interval for %s: %.1fs -> %.1fs", self.host, self._poll_interval, interval)
+            self._poll_interval = interval
+        # Land the next poll on this host's slot so devices stay spread out
+        self.update_interval = self._scheduler.next_interval(
+            self.host, interval, self._min_interval, started
+        )
+
+    async def _async_fetch_data(self, probe: bool = False) -> dict:
+        """Fetch data from Frixos device.
+
+        Status is fetched on every update; settings only when their slower
+        interval has elapsed or a write has made the cached copy stale.
+        A probe fetches status alone with a short timeout.
+        """
         await self._async_create_session()
         
+        fetch_settings = self._settings_due()
+        generation = self._write_generation
+        cached_settings = self._cached_settings()
+        
         try:
-            # Fetch both settings and status
-            settings_data, status_data = await asyncio.gather(
-                self._fetch_settings(),
-                self._fetch_status(),
-                return_exceptions=True
-            )
+            if probe:
+                status_data = await self._fetch_status(BREAKER_PROBE_TIMEOUT)
+                # Settings may have changed while the device was away
+                self._settings_stale = True
+                return {"settings": cached_settings, "status": status_data}
+
+            if fetch_settings:
+                settings_data, status_data = await asyncio.gather(
+                    self._fetch_settings(),
+                    self._fetch_status(),
+                    return_exceptions=True
+                )
+            else:
+                settings_data = cached_settings
+                (status_data,) = await asyncio.gather(
+                    self._fetch_status(),
+                    return_exceptions=True
+                )
             
             # Handle exceptions - if either fails completely, we still want to try to continue
+            settings_ok = status_ok = True
             if isinstance(settings_data, Exception):
                 _LOGGER.warning("Failed to fetch settings: %s", settings_data)
-                settings_data = {}
+                settings_ok = False
             elif not isinstance(settings_data, dict):
                 _LOGGER.warning("Settings data is not a dict: %s", type(settings_data))
-                settings_data = {}
+                settings_ok = False
                 
             if isinstance(status_data, Exception):
                 _LOGGER.warning("Failed to fetch status: %s", status_data)
-                status_data = {}
+                status_ok = False
             elif not isinstance(status_data, dict):
                 _LOGGER.warning("Status data is not a dict: %s", type(status_data))
-                status_data = {}
+                status_ok = False
+            
+            # Without a live status (and no fresh settings) the update fails
+            if not status_ok and not (fetch_settings and settings_ok):
+                # Unreachable only if no request got an answer from the device
+                unreachable = isinstance(status_data, DeviceUnreachable) and (
+                    not fetch_settings or isinstance(settings_data, DeviceUnreachable)
+                )
+                error = DeviceUnreachable if unreachable else UpdateFailed
+                if fetch_settings:
+                    raise error("Failed to fetch both settings and status from device")
+                raise error("Failed to fetch status from device")
             
-            # If both failed, raise an error
-            if not settings_data and not status_data:
-                raise UpdateFailed("Failed to fetch both settings and status from device")
+            # Settings read before a write was acknowledged lack that write
+            if settings_ok and generation != self._write_generation:
+                _LOGGER.debug("Not keeping settings of %s read before a write", self.host)
+                settings_ok = False
+                settings_data = self._cached_settings()
+            elif fetch_settings and settings_ok:
+                self._settings_fetched_at = time.monotonic()
+                self._settings_stale = False
             
-            # Combine data
+            # Combine data, keeping the last known settings if this fetch failed
             return {
-                "settings": settings_data or {},
-                "status": status_data or {},
+                "settings": settings_data if settings_ok else self._cached_settings(),
+                "status": status_data if status_ok else {},
             }
         except UpdateFailed:
             raise
         except Exception as err:
             raise UpdateFailed(f"Error communicating with device: {err}") from err
 
+    def _cached_settings(self) -> dict:
+        """Return the cached settings, including acknowledged writes."""
+        if isinstance(self.data, dict) and isinstance(self.data.get("settings"), dict):
+            return self.data["settings"]
+        return {}
+
+    def _settings_due(self) -> bool:
+        """Return True if settings should be fetched on this update."""
+        if self._settings_stale or self._settings_fetched_at is None:
+            return True
+        return time.monotonic() - self._settings_fetched_at >= self._settings_interval
+
     async def _fetch_settings(self) -> dict:
         """Fetch settings from device."""
-        if self._session is None:
-            await self._async_create_session()
-            
-        url = f"{self.base_url}{ENDPOINT_SETTINGS}"
-        try:
-            async with self._session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    if not isinstance(data, dict):
-                        raise UpdateFailed(f"Settings endpoint returned invalid data: {type(data)}")
-                    return data
-                else:
-                    text = await response.text()
-                    raise UpdateFailed(f"Settings endpoint returned status {response.status}: {text}")
-        except aiohttp.ClientError as err:
-            raise UpdateFailed(f"Network error fetching settings: {err}") from err
+        return await self._fetch_endpoint(ENDPOINT_SETTINGS, "Settings")
 
-    async def _fetch_status(self) -> dict:
+    async def _fetch_status(self, timeout: float = DEFAULT_TIMEOUT) -> dict:
         """Fetch status from device."""
+        return await self._fetch_endpoint(ENDPOINT_STATUS, "Status", timeout)
+
+    async def async_fetch_status(self) -> dict:
+        """Fetch only the status, queued like a scheduled poll.
+
+        The result does not replace the coordinator data.
+        """
+        return await self._fetch_status()
+
+    async def _fetch_endpoint(
+        self, endpoint: str, label: str, timeout: float = DEFAULT_TIMEOUT
+    ) -> dict:
+        """Fetch an endpoint through the request lane.
+
+        A fetch of the same endpoint still waiting on the lane is shared.
+        """
+        return await self.lane.async_run(
+            self._refresh_priority,
+            lambda: self._async_get_endpoint(endpoint, label, timeout),
+            key=f"GET {endpoint}",
+        )
+
+    async def _async_get_endpoint(
+        self, endpoint: str, label: str, timeout: float
+    ) -> dict:
+        """Fetch a JSON object from the device.
+
+        The decoded object is reused without decoding or validation when the
+        body is byte-identical to the previous one, or the device answers
+        304 Not Modified to our If-None-Match.
+        """
         if self._session is None:
             await self._async_create_session()
             
-        url = f"{self.base_url}{ENDPOINT_STATUS}"
+        cache = self._payload_cache[endpoint]
+        metrics = self.metrics
+        url = f"{self.base_url}{endpoint}"
+        headers = {hdrs.IF_NONE_MATCH: cache.etag} if cache.etag else None
+        started = time.perf_counter()
+        ok = False
         try:
-            async with self._session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
+            async with self._session.get(
+                url, headers=headers, timeout=aiohttp.ClientTimeout(total=timeout)
+            ) as response:
+                if response.status == 304 and cache.data is not None:
+                    cache.hits += 1
+                    cache.fetched_at = time.monotonic()
+                    ok = True
+                    return cache.data
                 if response.status == 200:
-                    data = await response.json()
+                    body = await response.read()
+                    cache.size = len(body)
+                    digest = hashlib.blake2b(body, digest_size=16).digest()
+                    if digest == cache.digest and cache.data is not None:
+                        cache.hits += 1
+                        cache.fetched_at = time.monotonic()
+                        ok = True
+                        return cache.data
+                    cache.misses += 1
+                    try:
+                        decode_started = time.perf_counter()
+                        data = json_loads(body)
+                        cache.decode_ms = round((time.perf_counter() - decode_started) * 1000, 3)
+                    except ValueError as err:
+                        metrics.parse_errors += 1
+                        raise UpdateFailed(f"{label} endpoint returned invalid JSON: {err}") from err
                     if not isinstance(data, dict):
-                        raise UpdateFailed(f"Status endpoint returned invalid data: {type(data)}")
+                        metrics.parse_errors += 1
+                        raise UpdateFailed(f"{label} endpoint returned invalid data: {type(data)}")
+                    cache.digest = digest
+                    cache.etag = response.headers.get(hdrs.ETAG)
+                    cache.data = data
+                    cache.fetched_at = time.monotonic()
+                    ok = True
                     return data
                 else:
+                    metrics.http_errors += 1
                     text = await response.text()
-                    raise UpdateFailed(f"Status endpoint returned status {response.status}: {text}")
+                    raise UpdateFailed(f"{label} endpoint returned status {response.status}: {text}")
+        except asyncio.TimeoutError as err:
+            metrics.timeouts += 1
+            raise DeviceUnreachable(f"Timeout fetching {label.lower()}") from err
+        except aiohttp.ClientConnectionError as err:
+            metrics.network_errors += 1
+            raise DeviceUnreachable(f"Network error fetching {label.lower()}: {err}") from err
         except aiohttp.ClientError as err:
-            raise UpdateFailed(f"Network error fetching status: {err}") from err
+            metrics.network_errors += 1
+            raise UpdateFailed(f"Error fetching {label.lower()}: {err}") from err
+        finally:
+            metrics.record_request(ok)
+            if ok:
+                metrics.record_latency(label.lower(), time.perf_counter() - started)
+
+    @property
+    def endpoint_stats(self) -> dict[str, dict[str, Any]]:
+        """Return payload statistics per endpoint.
+
+        Includes unchanged-body hits and misses, the last body size and
+        decode time, and seconds since the last successful fetch.
+        """
+        now = time.monotonic()
+        return {
+            endpoint: {
+                "hits": cache.hits,
+                "misses": cache.misses,
+                "payload_bytes": cache.size,
+                "decode_ms": cache.decode_ms,
+                "seconds_since_success": (
+                    round(now - cache.fetched_at, 1) if cache.fetched_at is not None else None
+                ),
+            }
+            for endpoint, cache in self._payload_cache.items()
+        }
+
+    @property
+    def pending_writes(self) -> dict[str, Any]:
+        """Return settings queued for the next batched write."""
+        return dict(self._pending_writes)
+
+    @property
+    def listener_count(self) -> int:
+        """Return the number of registered update listeners."""
+        return len(self._listeners)
+
+    def get_setting(self, param: str, default: Any = None) -> Any:
+        """Return a setting, preferring a value still queued or being written."""
+        if param in self._pending_writes:
+            return self._pending_writes[param]
+        for payload in reversed(self._inflight_writes):
+            if param in payload:
+                return payload[param]
+        if self.data and isinstance(self.data, dict):
+            settings = self.data.get("settings", {})
+            if isinstance(settings, dict):
+                return settings.get(param, default)
+        return default
 
-    async def async_set_setting(self, param: str, value: Any) -> bool:
+    def is_unconfirmed(self, param: str) -> bool:
+        """Return True if a value for param is queued or being written."""
+        return param in self._pending_writes or any(
+            param in payload for payload in self._inflight_writes
+        )
+
+    def _confirmed_setting(self, param: str) -> Any:
+        """Return a setting as last read from or acknowledged by the device."""
+        settings = self.data.get("settings") if isinstance(self.data, dict) else None
+        if isinstance(settings, dict):
+            return settings.get(param, _MISSING)
+        return _MISSING
+
+    async def async_set_setting(self, param: str, value: Any, force: bool = False) -> bool:
         """Update a setting on the device."""
+        return await self.async_set_settings({param: value}, force)
+
+    async def async_set_settings(self, values: dict[str, Any], force: bool = False) -> bool:
+        """Update several settings on the device.
+
+        Values the device is confirmed to have, with no other value queued
+        or being written, are not sent unless force is set; a write with
+        nothing left succeeds at once. Writes arriving within
+        WRITE_BATCH_WINDOW are merged into a single POST; every caller
+        receives the result of the batch it joined, including one repeating
+        a value that is still queued.
+        Writes fail immediately while the device is known to be unreachable.
+        """
+        if self.breaker.is_open:
+            _LOGGER.debug("Not writing %s, %s is unreachable", ", ".join(values), self.host)
+            return False
+
+        if not force:
+            changed = {
+                param: value
+                for param, value in values.items()
+                if self.is_unconfirmed(param)
+                or not values_equal(param, self._confirmed_setting(param), value)
+            }
+            self.metrics.skipped_values += len(values) - len(changed)
+            if not changed:
+                self.metrics.skipped_writes += 1
+                _LOGGER.debug("Not writing %s to %s, unchanged", ", ".join(values), self.host)
+                return True
+            values = changed
+
+        self._pending_writes.update(values)
+        result: asyncio.Future[bool] = self.hass.loop.create_future()
+        self._pending_results.append(result)
+
+        if self._flush_unsub is None:
+            self._flush_unsub = async_call_later(
+                self.hass, WRITE_BATCH_WINDOW, self._async_flush_writes
+            )
+
+        return await result
+
+    async def _async_flush_writes(self, _now: Any = None) -> None:
+        """Send all queued writes in one POST and resolve their callers."""
+        self._flush_unsub = None
+        payload, self._pending_writes = self._pending_writes, {}
+        results, self._pending_results = self._pending_results, []
+        if not payload:
+            return
+
+        success = False
+        self._inflight_writes.append(payload)
+        try:
+            # Writes jump ahead of any poll waiting for the device
+            success = await self.lane.async_run(
+                PRIORITY_WRITE, lambda: self._async_post_settings(payload)
+            )
+
+            if success:
+                self._async_apply_settings(payload)
+        finally:
+            self._inflight_writes.remove(payload)
+            for result in results:
+                if not result.done():
+                    result.set_result(success)
+
+    @callback
+    def _async_apply_settings(self, payload: dict[str, Any]) -> None:
+        """Apply acknowledged settings to the cached data and notify listeners.
+
+        The device is only re-read after the optional read-back delay;
+        otherwise the next scheduled poll confirms the written values.
+        """
+        self._write_generation += 1
+        # Poll at the floor right after a user write, when follow-ups are likely
+        self._poll_interval = self._min_interval
+        self.update_interval = timedelta(seconds=self._poll_interval)
+
+        # Re-read settings on the next poll to confirm what the device kept;
+        # the cached decode now holds the patched values, so never reuse it.
+        # Done before notifying listeners so a failing entity cannot skip it
+        self._settings_stale = True
+        self._payload_cache[ENDPOINT_SETTINGS].invalidate()
+
+        if self._readback_delay > 0:
+            if self._readback_unsub is not None:
+                self._readback_unsub()
+            self._readback_unsub = async_call_later(
+                self.hass, self._readback_delay, self._async_readback
+            )
+
+        if self.data and isinstance(self.data.get("settings"), dict):
+            self.data["settings"].update(payload)
+            # Also reschedules the next poll with the tightened interval
+            self.async_set_updated_data(self.data)
+
+    async def _async_readback(self, _now: Any = None) -> None:
+        """Re-read the device to confirm recently written settings."""
+        self._readback_unsub = None
+        await self.async_request_refresh()
+
+    async def _async_post_settings(self, payload: dict[str, Any]) -> bool:
+        """POST a settings payload to the device."""
         await self._async_create_session()
-        
+
         url = f"{self.base_url}{ENDPOINT_SETTINGS}"
-        payload = {param: value}
-        
+        params = ", ".join(payload)
+        metrics = self.metrics
+        started = time.perf_counter()
+        ok = False
+
         try:
             async with self._session.post(
                 url,
-                json=payload,
-                timeout=aiohttp.ClientTimeout(total=10)
+                data=json_dumps(payload),
+                headers={hdrs.CONTENT_TYPE: "application/json"},
+                timeout=aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT)
             ) as response:
                 if response.status == 200:
-                    result = await response.json()
-                    # Refresh data after successful update
-                    await self.async_request_refresh()
+                    try:
+                        result = json_loads(await response.read())
+                    except ValueError:
+                        metrics.parse_errors += 1
+                        raise
+                    ok = True
+                    metrics.record_latency("write", time.perf_counter() - started)
                     # API returns {"status": "ok"} on success
                     return result.get("status") == "ok" if isinstance(result, dict) else True
                 else:
+                    metrics.http_errors += 1
                     response_text = await response.text()
-                    _LOGGER.error("Failed to update setting %s: status %d, response: %s", param, response.status, response_text)
+                    _LOGGER.error("Failed to update settings %s: status %d, response: %s", params, response.status, response_text)
                     return False
         except Exception as err:
-            _LOGGER.error("Error updating setting %s: %s", param, err)
+            if isinstance(err, asyncio.TimeoutError):
+                metrics.timeouts += 1
+                self.breaker.record_failure()
+            elif isinstance(err, aiohttp.ClientError):
+                metrics.network_errors += 1
+                if isinstance(err, aiohttp.ClientConnectionError):
+                    self.breaker.record_failure()
+            _LOGGER.error("Error updating settings %s: %s", params, err)
             return False
+        finally:
+            metrics.record_request(ok)
 
     async def async_close(self) -> None:
-        """Close the aiohttp session."""
-        if self._session:
-            await self._session.close()
-            self._session = None
+        """Cancel pending work and detach from the shared session."""
+        await self.messages.async_close()
+        if self.lux_sampler is not None:
+            self.lux_sampler.async_stop()
+        if self._flush_unsub is not None:
+            self._flush_unsub()
+            self._flush_unsub = None
+        if self._readback_unsub is not None:
+            self._readback_unsub()
+            self._readback_unsub = None
+        self._pending_writes = {}
+        results, self._pending_results = self._pending_results, []
+        for result in results:
+            if not result.done():
+                result.set_result(False)
+        await self.lane.async_close()
+
+        # Write the snapshot now rather than leaving a delayed save behind
+        if self._store is not None and isinstance(self.data, dict) and not self.stale:
+            await self._store.async_save(self._snapshot_to_save())
+
+        # The shared session itself is closed by the integration
+        self._session = None
@@ -0,0 +1,45 @@
+"""Diagnostics support for Frixos."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, SECRET_PARAMS
+from .coordinator import FrixosDataUpdateCoordinator
+
+TO_REDACT = SECRET_PARAMS
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: FrixosDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    return {
+        "entry": {
+            "data": dict(entry.data),
+            "options": dict(entry.options),
+        },
+        "coordinator": {
+            "last_update_success": coordinator.last_update_success,
+            "poll_interval": coordinator.poll_interval,
+            "next_poll_in": coordinator.update_interval.total_seconds()
+            if coordinator.update_interval
+            else None,
+            "listener_count": coordinator.listener_count,
+            "pending_writes": async_redact_data(coordinator.pending_writes, TO_REDACT),
+            "endpoints": coordinator.endpoint_stats,
+            "metrics": coordinator.metrics.as_dict(),
+            "circuit_breaker": coordinator.breaker.as_dict(),
+            "request_lane": coordinator.lane.as_dict(),
+            "messages": coordinator.messages.as_dict(),
+            "lux_sampler": coordinator.lux_sampler.as_dict()
+            if coordinator.lux_sampler
+            else None,
+        },
+        "data": async_redact_data(coordinator.data or {}, TO_REDACT),
+    }
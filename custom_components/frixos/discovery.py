@@ -0,0 +1,140 @@
+"""LAN scan for Frixos devices."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Container, Iterator
+import ipaddress
+import logging
+
+import aiohttp
+
+from .codec import json_loads
+from .const import (
+    DEFAULT_PORT,
+    DISCOVERY_CONCURRENCY,
+    DISCOVERY_CONNECT_TIMEOUT,
+    DISCOVERY_DEADLINE,
+    DISCOVERY_MAX_BODY,
+    DISCOVERY_MAX_HOSTS,
+    DISCOVERY_TIMEOUT,
+    ENDPOINT_STATUS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class FrixosDiscovery:
+    """A Frixos device that answered the scan."""
+
+    __slots__ = ("host", "port", "app", "version")
+
+    def __init__(self, host: str, port: int, app: str, version: str) -> None:
+        """Initialize."""
+        self.host = host
+        self.port = port
+        self.app = app
+        self.version = version
+
+    @property
+    def unique_id(self) -> str:
+        """Return the config entry unique_id for this device."""
+        return f"{self.host}:{self.port}"
+
+    def __repr__(self) -> str:
+        """Return a debug representation."""
+        return f"FrixosDiscovery({self.unique_id}, {self.app} {self.version})"
+
+
+def parse_network(network: str) -> ipaddress.IPv4Network | ipaddress.IPv6Network:
+    """Parse a network such as 192.168.1.0/24, raising ValueError if unusable."""
+    parsed = ipaddress.ip_network(network.strip(), strict=False)
+    if parsed.num_addresses > DISCOVERY_MAX_HOSTS + 2:
+        raise ValueError(f"{parsed} is too large to scan (max {DISCOVERY_MAX_HOSTS} hosts)")
+    return parsed
+
+
+async def async_scan_network(
+    session: aiohttp.ClientSession,
+    network: str,
+    port: int = DEFAULT_PORT,
+    *,
+    skip: Container[str] = (),
+    max_results: int | None = None,
+    concurrency: int = DISCOVERY_CONCURRENCY,
+    deadline: float = DISCOVERY_DEADLINE,
+) -> list[FrixosDiscovery]:
+    """Probe every address of network for a Frixos status endpoint.
+
+    A fixed pool of workers pulls addresses from one iterator, so at most
+    concurrency probes are in flight. The scan stops early once max_results
+    devices answered or the deadline passed. Addresses whose host:port is
+    in skip (already configured) are not probed.
+    """
+    parsed = parse_network(network)
+    addresses: Iterator[str] = (
+        str(address)
+        for address in parsed.hosts()
+        if f"{address}:{port}" not in skip
+    )
+    timeout = aiohttp.ClientTimeout(
+        total=DISCOVERY_TIMEOUT, sock_connect=DISCOVERY_CONNECT_TIMEOUT
+    )
+    found: list[FrixosDiscovery] = []
+    enough = asyncio.Event()
+
+    async def worker() -> None:
+        """Probe addresses until none are left or enough devices were found."""
+        for host in addresses:
+            device = await _async_probe(session, host, port, timeout)
+            if device is None:
+                continue
+            found.append(device)
+            if max_results is not None and len(found) >= max_results:
+                enough.set()
+                return
+
+    workers = [asyncio.create_task(worker()) for _ in range(max(1, concurrency))]
+    all_done = asyncio.gather(*workers)
+    waiter = asyncio.create_task(enough.wait())
+    try:
+        await asyncio.wait(
+            [all_done, waiter], timeout=deadline, return_when=asyncio.FIRST_COMPLETED
+        )
+    finally:
+        # Stop probes still in flight once the result is known
+        for task in (*workers, waiter):
+            task.cancel()
+        await asyncio.gather(all_done, waiter, return_exceptions=True)
+
+    _LOGGER.debug("Scan of %s found %d Frixos device(s)", parsed, len(found))
+    return sorted(found, key=lambda device: ipaddress.ip_address(device.host))
+
+
+async def _async_probe(
+    session: aiohttp.ClientSession,
+    host: str,
+    port: int,
+    timeout: aiohttp.ClientTimeout,
+) -> FrixosDiscovery | None:
+    """Return the device at host if its status identifies it as a Frixos."""
+    url_host = f"[{host}]" if ":" in host else host
+    try:
+        async with session.get(
+            f"http://{url_host}:{port}{ENDPOINT_STATUS}",
+            timeout=timeout,
+            allow_redirects=False,
+        ) as response:
+            if response.status != 200:
+                return None
+            if (response.content_length or 0) > DISCOVERY_MAX_BODY:
+                return None
+            status = json_loads(await response.read())
+    except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+        return None
+
+    if not isinstance(status, dict):
+        return None
+    app = status.get("app")
+    if not isinstance(app, str) or "frixos" not in app.lower():
+        return None
+    return FrixosDiscovery(host, port, app, str(status.get("version", "Unknown")))
@@ -1,43 +1,120 @@
 """Base entity for Frixos integration."""
 from __future__ import annotations
 
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any
+
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
 from .coordinator import FrixosDataUpdateCoordinator
+from .snapshot import FrixosSnapshot
+
+
+class FrixosValueSpec:
+    """Precompiled access path from coordinator data to one entity value.
+
+    Built once per entity description so state reads are a couple of dict
+    lookups instead of re-parsing the description key every time. The
+    coordinator converts the value once per poll into its snapshot.
+    """
+
+    __slots__ = ("section", "param", "index", "options", "reverse", "convert")
+
+    def __init__(
+        self,
+        param: str,
+        section: str = "settings",
+        index: int | None = None,
+        options: Mapping[Any, str] | None = None,
+        convert: Callable[[Any], Any] | None = None,
+    ) -> None:
+        """Initialize the spec."""
+        self.section = section
+        self.param = param
+        # Position within an array setting such as the p23 brightness pair
+        self.index = index
+        # Device value -> option label, and label -> device value for writes
+        self.options = dict(options) if options else None
+        self.reverse = {label: value for value, label in options.items()} if options else None
+        self.convert = convert
+
+    def present(self, data: dict[str, Any] | None) -> bool:
+        """Return True if the device reports this value, or it cannot tell yet.
+
+        Older firmware lacks some parameters; their entities are not created.
+        """
+        section = data.get(self.section) if isinstance(data, dict) else None
+        if not isinstance(section, dict) or not section:
+            return True
+        if self.param not in section:
+            return False
+        if self.index is None:
+            return True
+        value = section[self.param]
+        return isinstance(value, list) and self.index < len(value)
+
+    def read(self, snapshot: FrixosSnapshot) -> Any:
+        """Return the converted value from the coordinator snapshot, or None."""
+        try:
+            return snapshot.values[self]
+        except KeyError:
+            # Not tracked by the coordinator (yet), convert on the spot
+            return self.extract(snapshot.data)
+
+    def extract(self, data: dict[str, Any] | None) -> Any:
+        """Return the converted value from coordinator data, or None."""
+        if data is None:
+            return None
+        value = data[self.section].get(self.param)
+        if self.index is not None:
+            if not isinstance(value, list) or self.index >= len(value):
+                return None
+            value = value[self.index]
+        if value is None or self.convert is None:
+            return value
+        try:
+            return self.convert(value)
+        except (ValueError, TypeError):
+            return None
 
 
 class FrixosEntity(CoordinatorEntity):
     """Base entity for Frixos devices."""
 
+    # Set by entities reading a device value, before calling __init__
+    _spec: FrixosValueSpec | None = None
+
     def __init__(
         self,
         coordinator: FrixosDataUpdateCoordinator,
         unique_id: str,
         name: str,
         icon: str | None = None,
+        keys: Iterable[str] | None = None,
     ) -> None:
-        """Initialize the entity."""
-        super().__init__(coordinator)
+        """Initialize the entity.
+
+        keys lists the settings/status keys the entity reads; it is then only
+        updated when one of them changes. Without keys it updates every poll.
+        """
+        super().__init__(coordinator, frozenset(keys) if keys is not None else None)
         self._attr_unique_id = unique_id
         self._attr_name = name
         self._attr_icon = icon
 
+    async def async_added_to_hass(self) -> None:
+        """Have the coordinator convert this entity's value once per poll."""
+        await super().async_added_to_hass()
+        if self._spec is not None:
+            self.async_on_remove(self.coordinator.async_track_spec(self._spec))
+
+    @property
+    def assumed_state(self) -> bool:
+        """Return True while showing the cached snapshot from before a restart."""
+        return self.coordinator.stale
+
     @property
     def device_info(self) -> DeviceInfo:
         """Return device information."""
-        # Safely get version from coordinator data
-        version = "Unknown"
-        if self.coordinator.data and isinstance(self.coordinator.data, dict):
-            status = self.coordinator.data.get("status", {})
-            if isinstance(status, dict):
-                version = status.get("version", "Unknown")
-        
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.coordinator.host)},
-            name=self.coordinator.host,
-            manufacturer="Frixos",
-            model="Frixos Device",
-            sw_version=version,
-        )
+        return self.coordinator.device_info
@@ -0,0 +1,151 @@
+"""Per-device request lane for the Frixos integration."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import heapq
+import itertools
+from typing import Any, TypeVar
+
+from .const import PRIORITY_POLL, PRIORITY_REFRESH, PRIORITY_WRITE
+
+_T = TypeVar("_T")
+
+PRIORITY_NAMES = {
+    PRIORITY_WRITE: "write",
+    PRIORITY_REFRESH: "refresh",
+    PRIORITY_POLL: "poll",
+}
+
+
+def _retrieve(future: asyncio.Future[Any]) -> None:
+    """Mark an error as seen even if every caller stopped waiting."""
+    if not future.cancelled():
+        future.exception()
+
+
+class _LaneRequest:
+    """A request waiting in or running on the lane."""
+
+    __slots__ = ("priority", "key", "factory", "future", "started")
+
+    def __init__(
+        self,
+        priority: int,
+        key: str | None,
+        factory: Callable[[], Awaitable[Any]],
+        future: asyncio.Future[Any],
+    ) -> None:
+        """Initialize."""
+        self.priority = priority
+        self.key = key
+        self.factory = factory
+        self.future = future
+        self.started = False
+        future.add_done_callback(_retrieve)
+
+
+class FrixosRequestLane:
+    """Send one request at a time to a device, most important first.
+
+    The firmware serves a single connection, so requests are queued here
+    instead of competing for its socket. Writes go before on-demand
+    refreshes, which go before scheduled polls. A request submitted with
+    the key of one still waiting is merged into it and shares its result,
+    and raises its priority if the new request is more important.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an idle lane."""
+        self._queue: list[tuple[int, int, _LaneRequest]] = []
+        self._waiting: dict[str, _LaneRequest] = {}
+        self._sequence = itertools.count()
+        self._runner: asyncio.Task[None] | None = None
+        self.submitted = {name: 0 for name in PRIORITY_NAMES.values()}
+        self.merged = 0
+        self.max_depth = 0
+
+    @property
+    def depth(self) -> int:
+        """Return the number of requests waiting to run."""
+        return sum(
+            1
+            for priority, _, request in self._queue
+            if not request.started and priority == request.priority
+        )
+
+    async def async_run(
+        self,
+        priority: int,
+        factory: Callable[[], Awaitable[_T]],
+        key: str | None = None,
+    ) -> _T:
+        """Queue factory on the lane and return its result once it has run."""
+        self.submitted[PRIORITY_NAMES[priority]] += 1
+        request = self._waiting.get(key) if key is not None else None
+        if request is not None:
+            self.merged += 1
+            if priority < request.priority:
+                # Re-queue at the new priority; the old heap entry is skipped
+                request.priority = priority
+                self._push(request)
+        else:
+            request = _LaneRequest(
+                priority, key, factory, asyncio.get_running_loop().create_future()
+            )
+            if key is not None:
+                self._waiting[key] = request
+            self._push(request)
+            if self._runner is None or self._runner.done():
+                self._runner = asyncio.create_task(self._async_drain())
+
+        # Callers cancelled while waiting leave the request for the others
+        return await asyncio.shield(request.future)
+
+    def _push(self, request: _LaneRequest) -> None:
+        """Add a request to the priority queue."""
+        heapq.heappush(self._queue, (request.priority, next(self._sequence), request))
+        self.max_depth = max(self.max_depth, self.depth)
+
+    async def _async_drain(self) -> None:
+        """Run queued requests one at a time until the queue is empty."""
+        while self._queue:
+            priority, _, request = heapq.heappop(self._queue)
+            if request.started or priority != request.priority:
+                continue
+            request.started = True
+            if request.key is not None:
+                self._waiting.pop(request.key, None)
+            try:
+                result = await request.factory()
+            except asyncio.CancelledError:
+                request.future.cancel()
+                raise
+            except Exception as err:  # pylint: disable=broad-except
+                request.future.set_exception(err)
+            else:
+                request.future.set_result(result)
+
+    async def async_close(self) -> None:
+        """Cancel the running request and everything still queued."""
+        if self._runner is not None and not self._runner.done():
+            self._runner.cancel()
+            try:
+                await self._runner
+            except asyncio.CancelledError:
+                pass
+        self._runner = None
+        for _, _, request in self._queue:
+            if not request.future.done():
+                request.future.cancel()
+        self._queue.clear()
+        self._waiting.clear()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return lane counters for diagnostics."""
+        return {
+            "depth": self.depth,
+            "max_depth": self.max_depth,
+            "merged": self.merged,
+            "submitted": dict(self.submitted),
+        }
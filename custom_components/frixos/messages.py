@@ -0,0 +1,153 @@
+"""Paced scrolling message queue for the Frixos integration."""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+
+from .const import (
+    MESSAGE_MAX_BYTES,
+    MESSAGE_MIN_INTERVAL,
+    MESSAGE_QUEUE_SIZE,
+    PARAM_MESSAGE,
+    PARAM_MSG_COLOR,
+    PARAM_NIGHT_MSG_COLOR,
+)
+from .values import normalize_color
+
+if TYPE_CHECKING:
+    from .coordinator import FrixosDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def truncate_message(message: str) -> str:
+    """Cut a message to what fits the device's buffer, on a character boundary."""
+    encoded = message.encode()
+    if len(encoded) <= MESSAGE_MAX_BYTES:
+        return message
+    return encoded[:MESSAGE_MAX_BYTES].decode(errors="ignore")
+
+
+class _Message:
+    """A message waiting to be sent, with the settings folded into its POST."""
+
+    __slots__ = ("tag", "values")
+
+    def __init__(self, tag: str | None, values: dict[str, Any]) -> None:
+        """Initialize."""
+        self.tag = tag
+        self.values = values
+
+
+class FrixosMessageQueue:
+    """Bounded queue of scrolling messages sent to one device at a paced rate.
+
+    Messages are sent one POST at a time, at most one every
+    MESSAGE_MIN_INTERVAL seconds. A message with the tag of one still
+    queued replaces it in place, a message identical to the last one queued
+    is ignored, and when the queue is full the oldest message is dropped.
+    """
+
+    def __init__(self, coordinator: FrixosDataUpdateCoordinator) -> None:
+        """Initialize an empty queue."""
+        self._coordinator = coordinator
+        self._queue: deque[_Message] = deque()
+        self._task: asyncio.Task[None] | None = None
+        self._last_sent = 0.0
+        self.sent = 0
+        self.failed = 0
+        self.replaced = 0
+        self.duplicates = 0
+        self.dropped = 0
+        self.truncated = 0
+
+    @property
+    def depth(self) -> int:
+        """Return the number of messages waiting to be sent."""
+        return len(self._queue)
+
+    def async_push(
+        self,
+        message: str,
+        color: str | None = None,
+        night_color: str | None = None,
+        tag: str | None = None,
+    ) -> None:
+        """Queue a message, optionally with its day and night colors."""
+        text = truncate_message(message)
+        if text != message:
+            self.truncated += 1
+        values: dict[str, Any] = {PARAM_MESSAGE: text}
+        if color:
+            values[PARAM_MSG_COLOR] = normalize_color(color)
+        if night_color:
+            values[PARAM_NIGHT_MSG_COLOR] = normalize_color(night_color)
+
+        self._async_enqueue(_Message(tag, values))
+        if self._task is None or self._task.done():
+            self._task = self._coordinator.hass.async_create_background_task(
+                self._async_run(), f"frixos messages {self._coordinator.host}"
+            )
+        # Let the diagnostic sensors show the new depth
+        self._coordinator.async_update_listeners()
+
+    def _async_enqueue(self, new: _Message) -> None:
+        """Add a message, collapsing it into one it supersedes."""
+        if new.tag is not None:
+            for index, queued in enumerate(self._queue):
+                if queued.tag == new.tag:
+                    self._queue[index] = new
+                    self.replaced += 1
+                    return
+        if self._queue and self._queue[-1].values == new.values:
+            self.duplicates += 1
+            return
+        if len(self._queue) >= MESSAGE_QUEUE_SIZE:
+            self._queue.popleft()
+            self.dropped += 1
+        self._queue.append(new)
+
+    async def _async_run(self) -> None:
+        """Send queued messages until the queue is empty."""
+        while self._queue:
+            wait = self._last_sent + MESSAGE_MIN_INTERVAL - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+                # Messages may have been replaced while waiting
+                if not self._queue:
+                    break
+            message = self._queue.popleft()
+            self._last_sent = time.monotonic()
+            if await self._coordinator.async_set_settings(message.values):
+                self.sent += 1
+            else:
+                # Not retried: by now it would be stale, and a backlog would pile up
+                self.failed += 1
+                _LOGGER.debug("Dropped message for %s after a failed write", self._coordinator.host)
+            self._coordinator.async_update_listeners()
+
+    async def async_close(self) -> None:
+        """Stop sending and discard queued messages."""
+        self._queue.clear()
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return queue counters for diagnostics."""
+        return {
+            "depth": self.depth,
+            "sent": self.sent,
+            "failed": self.failed,
+            "replaced": self.replaced,
+            "duplicates": self.duplicates,
+            "dropped": self.dropped,
+            "truncated": self.truncated,
+        }
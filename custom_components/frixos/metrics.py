@@ -0,0 +1,122 @@
+"""Request latency and error metrics for Frixos devices."""
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import deque
+
+from .const import DIAGNOSTICS_RECENT_SAMPLES, LATENCY_BUCKETS_MS, METRICS_DECAY_SAMPLES
+
+
+class LatencyHistogram:
+    """Latency histogram over fixed millisecond buckets.
+
+    Counts are halved once they reach METRICS_DECAY_SAMPLES, so the
+    percentiles follow recent behaviour in bounded memory.
+    """
+
+    __slots__ = ("_counts", "_total")
+
+    def __init__(self) -> None:
+        """Initialize an empty histogram."""
+        # One extra bucket for samples above the largest bound
+        self._counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self._total = 0
+
+    def record(self, seconds: float) -> None:
+        """Record one request duration."""
+        self._counts[bisect_left(LATENCY_BUCKETS_MS, seconds * 1000)] += 1
+        self._total += 1
+        if self._total >= METRICS_DECAY_SAMPLES:
+            self._counts = [count // 2 for count in self._counts]
+            self._total = sum(self._counts)
+
+    def percentile(self, pct: float) -> float | None:
+        """Return the upper bound in ms of the bucket holding the percentile."""
+        if not self._total:
+            return None
+        rank = pct / 100 * self._total
+        seen = 0
+        for index, count in enumerate(self._counts):
+            seen += count
+            if seen >= rank and count:
+                return float(LATENCY_BUCKETS_MS[min(index, len(LATENCY_BUCKETS_MS) - 1)])
+        return float(LATENCY_BUCKETS_MS[-1])
+
+    def as_dict(self) -> dict[str, int]:
+        """Return bucket counts keyed by their upper bound."""
+        labels = [f"le_{bound}ms" for bound in LATENCY_BUCKETS_MS] + ["overflow"]
+        return dict(zip(labels, self._counts))
+
+
+class FrixosMetrics:
+    """Per-device request latency histograms and error counters."""
+
+    def __init__(self) -> None:
+        """Initialize empty metrics."""
+        # "poll" is a whole update, "settings"/"status" single GETs
+        self.latency: dict[str, LatencyHistogram] = {
+            name: LatencyHistogram() for name in ("poll", "settings", "status", "write")
+        }
+        # Exact durations of the latest requests, for diagnostics
+        self.recent: dict[str, deque[float]] = {
+            name: deque(maxlen=DIAGNOSTICS_RECENT_SAMPLES) for name in self.latency
+        }
+        self.requests = 0
+        self.timeouts = 0
+        self.http_errors = 0
+        self.parse_errors = 0
+        self.network_errors = 0
+        # Writes that matched the cached settings and were not sent
+        self.skipped_writes = 0
+        self.skipped_values = 0
+        # Decayed like the histograms, for a recent error rate
+        self._recent_requests = 0
+        self._recent_errors = 0
+
+    def record_latency(self, name: str, seconds: float) -> None:
+        """Record the duration of a successful request or poll."""
+        self.latency[name].record(seconds)
+        self.recent[name].append(round(seconds * 1000, 1))
+
+    def record_request(self, ok: bool) -> None:
+        """Count a request and whether it succeeded."""
+        self.requests += 1
+        self._recent_requests += 1
+        if not ok:
+            self._recent_errors += 1
+        if self._recent_requests >= METRICS_DECAY_SAMPLES:
+            self._recent_requests //= 2
+            self._recent_errors //= 2
+
+    def latency_percentile(self, name: str, pct: float) -> float | None:
+        """Return a latency percentile in ms for one histogram."""
+        return self.latency[name].percentile(pct)
+
+    @property
+    def error_rate(self) -> float | None:
+        """Return the recent share of failed requests in percent."""
+        if not self._recent_requests:
+            return None
+        return round(100 * self._recent_errors / self._recent_requests, 1)
+
+    def as_dict(self) -> dict[str, object]:
+        """Return all metrics for diagnostics."""
+        return {
+            "requests": self.requests,
+            "timeouts": self.timeouts,
+            "http_errors": self.http_errors,
+            "parse_errors": self.parse_errors,
+            "network_errors": self.network_errors,
+            "skipped_writes": self.skipped_writes,
+            "skipped_values": self.skipped_values,
+            "error_rate": self.error_rate,
+            "latency_ms": {
+                name: {
+                    "p50": histogram.percentile(50),
+                    "p95": histogram.percentile(95),
+                    "buckets": histogram.as_dict(),
+                    "recent": list(self.recent[name]),
+                }
+                for name, histogram in self.latency.items()
+            },
+        }
@@ -22,7 +22,7 @@ from .const import (
     PARAM_DEXCOM_REFRESH,
 )
 from .coordinator import FrixosDataUpdateCoordinator
-from .entity import FrixosEntity
+from .entity import FrixosEntity, FrixosValueSpec
 
 NUMBER_DESCRIPTIONS: tuple[NumberEntityDescription, ...] = (
     NumberEntityDescription(
@@ -131,6 +131,8 @@ NUMBER_DESCRIPTIONS: tuple[NumberEntityDescription, ...] = (
         native_step=1,
         native_unit_of_measurement="min",
         entity_category=EntityCategory.CONFIG,
+        # Only used with the stock ticker
+        entity_registry_enabled_default=False,
     ),
     NumberEntityDescription(
         key=PARAM_DEXCOM_REFRESH,
@@ -141,10 +143,28 @@ NUMBER_DESCRIPTIONS: tuple[NumberEntityDescription, ...] = (
         native_step=1,
         native_unit_of_measurement="min",
         entity_category=EntityCategory.CONFIG,
+        # Only used with the Dexcom feature
+        entity_registry_enabled_default=False,
     ),
 )
 
 
+def _compile_spec(key: str) -> FrixosValueSpec:
+    """Return the value spec for a number description key."""
+    # LED brightness entities read one index of the p23 array
+    if key.startswith(f"{PARAM_BRIGHTNESS_LED}_"):
+        return FrixosValueSpec(
+            PARAM_BRIGHTNESS_LED, index=int(key.split("_")[-1]), convert=float
+        )
+    return FrixosValueSpec(key, convert=float)
+
+
+NUMBER_SPECS: dict[str, FrixosValueSpec] = {
+    description.key: _compile_spec(description.key)
+    for description in NUMBER_DESCRIPTIONS
+}
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -156,6 +176,7 @@ async def async_setup_entry(
     entities = [
         FrixosNumber(coordinator, description)
         for description in NUMBER_DESCRIPTIONS
+        if NUMBER_SPECS[description.key].present(coordinator.data)
     ]
 
     async_add_entities(entities)
@@ -170,50 +191,34 @@ class FrixosNumber(FrixosEntity, NumberEntity):
         description: NumberEntityDescription,
     ) -> None:
         """Initialize the number entity."""
+        self._spec = NUMBER_SPECS[description.key]
         super().__init__(
             coordinator,
             f"{coordinator.host}_{description.key}",
             description.name,
             description.icon,
+            (self._spec.param,),
         )
         self.entity_description = description
 
     @property
     def native_value(self) -> float | None:
         """Return the current value."""
-        if not self.coordinator.data or not isinstance(self.coordinator.data, dict):
-            return None
-        
-        settings = self.coordinator.data.get("settings", {})
-        if not isinstance(settings, dict):
-            return None
-        
-        # Handle brightness LED array (indexed by _0 or _1 suffix)
-        if self.entity_description.key.startswith(f"{PARAM_BRIGHTNESS_LED}_"):
-            brightness_array = settings.get(PARAM_BRIGHTNESS_LED, [])
-            if isinstance(brightness_array, list):
-                index = int(self.entity_description.key.split("_")[-1])
-                if index < len(brightness_array):
-                    return float(brightness_array[index])
-            return None
-        
-        value = settings.get(self.entity_description.key)
-        return float(value) if value is not None else None
+        return self._spec.read(self.coordinator.snapshot)
 
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value."""
-        param_key = self.entity_description.key
+        spec = self._spec
         
         # Handle brightness LED array
-        if param_key.startswith(f"{PARAM_BRIGHTNESS_LED}_"):
-            settings = self.coordinator.data.get("settings", {})
-            brightness_array = list(settings.get(PARAM_BRIGHTNESS_LED, [0, 0]))
-            index = int(param_key.split("_")[-1])
-            brightness_array[index] = int(value)
+        if spec.index is not None:
+            # Build on a queued write so day/night changes in one batch both apply
+            brightness_array = list(self.coordinator.get_setting(spec.param, [0, 0]))
+            brightness_array[spec.index] = int(value)
             
-            success = await self.coordinator.async_set_setting(PARAM_BRIGHTNESS_LED, brightness_array)
+            success = await self.coordinator.async_set_setting(spec.param, brightness_array)
         else:
-            success = await self.coordinator.async_set_setting(param_key, value)
+            success = await self.coordinator.async_set_setting(spec.param, value)
         
         if success:
             self.async_write_ha_state()
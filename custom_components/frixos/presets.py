@@ -0,0 +1,92 @@
+"""Named display presets for the Frixos integration."""
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    DATA_PRESETS,
+    DOMAIN,
+    RESTART_REQUIRED_PARAMS,
+    SECRET_PARAMS,
+    STORAGE_VERSION,
+)
+from .coordinator import FrixosDataUpdateCoordinator
+from .values import values_equal
+
+
+class FrixosPresets:
+    """Presets shared by all Frixos devices, persisted in .storage."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize."""
+        self._store: Store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.presets")
+        self._presets: dict[str, dict[str, Any]] | None = None
+
+    async def async_load(self) -> dict[str, dict[str, Any]]:
+        """Return all presets, loading them from storage on first use."""
+        if self._presets is None:
+            data = await self._store.async_load() or {}
+            self._presets = data.get("presets", {})
+        return self._presets
+
+    async def async_get(self, name: str) -> dict[str, Any] | None:
+        """Return the preset called name, if any."""
+        return (await self.async_load()).get(name)
+
+    async def async_save(self, name: str, values: dict[str, Any]) -> None:
+        """Store values as the preset called name, replacing an existing one."""
+        presets = await self.async_load()
+        presets[name] = values
+        await self._store.async_save({"presets": presets})
+
+
+@callback
+def async_get_presets(hass: HomeAssistant) -> FrixosPresets:
+    """Return the integration's preset store, creating it if needed."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if (presets := domain_data.get(DATA_PRESETS)) is None:
+        presets = domain_data[DATA_PRESETS] = FrixosPresets(hass)
+    return presets
+
+
+def capture_preset(
+    coordinator: FrixosDataUpdateCoordinator, params: Iterable[str] | None = None
+) -> dict[str, Any]:
+    """Return the device's current settings for a preset, without secrets."""
+    settings = (coordinator.data or {}).get("settings") or {}
+    keys = settings if params is None else [key for key in params if key in settings]
+    return {
+        key: coordinator.get_setting(key)
+        for key in keys
+        if key not in SECRET_PARAMS
+    }
+
+
+def preset_diff(
+    coordinator: FrixosDataUpdateCoordinator,
+    preset: dict[str, Any],
+    allow_restart: bool = False,
+) -> tuple[dict[str, Any], list[str]]:
+    """Return the preset values that differ from the device's settings.
+
+    Parameters that make the device restart are left out unless allowed.
+    Parameters the device does not report (older firmware) are left out
+    too, since the device rejects the whole write otherwise; they are
+    returned as the second item.
+    """
+    settings = (coordinator.data or {}).get("settings") or {}
+    changed: dict[str, Any] = {}
+    skipped: list[str] = []
+    for key, value in preset.items():
+        if not allow_restart and key in RESTART_REQUIRED_PARAMS:
+            continue
+        if key not in settings:
+            skipped.append(key)
+        elif coordinator.is_unconfirmed(key) or not values_equal(key, settings[key], value):
+            # A value queued or being written may differ from the preset
+            changed[key] = value
+    return changed, sorted(skipped)
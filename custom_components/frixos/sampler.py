@@ -0,0 +1,263 @@
+"""Light level sampling and rolling statistics for Frixos devices."""
+from __future__ import annotations
+
+from array import array
+from collections import deque
+from collections.abc import Callable, Iterable
+from datetime import timedelta
+import logging
+import math
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+from .const import LUX_MAX_WINDOW, LUX_MAX_WINDOWS, LUX_MIN_WINDOW, LUX_PUBLISH_INTERVAL
+
+if TYPE_CHECKING:
+    from .coordinator import FrixosDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def parse_windows(text: str) -> list[int]:
+    """Parse window lengths in seconds such as "60, 300", raising ValueError."""
+    windows = sorted({int(part) for part in text.replace(",", " ").split()})
+    if not 1 <= len(windows) <= LUX_MAX_WINDOWS:
+        raise ValueError(f"Between 1 and {LUX_MAX_WINDOWS} windows are supported")
+    if windows[0] < LUX_MIN_WINDOW or windows[-1] > LUX_MAX_WINDOW:
+        raise ValueError(f"Windows must be {LUX_MIN_WINDOW}-{LUX_MAX_WINDOW} seconds")
+    return windows
+
+
+class SampleBuffer:
+    """Fixed-size ring of float samples in one flat array of doubles.
+
+    Samples are addressed by their absolute index; only the latest size
+    samples are kept.
+    """
+
+    __slots__ = ("_values", "size", "count")
+
+    def __init__(self, size: int) -> None:
+        """Initialize an empty buffer."""
+        self._values = array("d", bytes(8 * size))
+        self.size = size
+        self.count = 0
+
+    def append(self, value: float) -> int:
+        """Store a sample, overwriting the oldest, and return its index."""
+        index = self.count
+        self._values[index % self.size] = value
+        self.count = index + 1
+        return index
+
+    def __getitem__(self, index: int) -> float:
+        """Return the sample at an absolute index still held."""
+        return self._values[index % self.size]
+
+
+class RollingWindow:
+    """Mean, min, max and least-squares slope of the latest length samples.
+
+    Each sample updates the statistics in O(1): the sums behind the mean
+    and slope are adjusted by the sample entering and the one leaving, and
+    min/max come from monotonic queues of sample indexes (amortized O(1)).
+    The sums are recomputed from the buffer once every length samples so
+    rounding errors cannot build up.
+    """
+
+    __slots__ = ("length", "count", "_buffer", "_sum", "_weighted", "_min", "_max")
+
+    def __init__(self, length: int, buffer: SampleBuffer) -> None:
+        """Initialize an empty window over buffer."""
+        if length >= buffer.size:
+            raise ValueError("The buffer must hold one sample more than the window")
+        self.length = length
+        self.count = 0
+        self._buffer = buffer
+        # Sum of the samples, and of each sample times its position (0 = oldest)
+        self._sum = 0.0
+        self._weighted = 0.0
+        self._min: deque[int] = deque()
+        self._max: deque[int] = deque()
+
+    def add(self, index: int) -> None:
+        """Account for the sample just stored in the buffer at index."""
+        buffer = self._buffer
+        value = buffer[index]
+        count = self.count
+        if count < self.length:
+            self._weighted += count * value
+            self._sum += value
+            self.count = count + 1
+        else:
+            # Every other sample moves one position towards the oldest
+            oldest = buffer[index - count]
+            self._weighted += (count - 1) * value - (self._sum - oldest)
+            self._sum += value - oldest
+            if index % self.length == 0:
+                self._resum(index)
+
+        # Drop queued samples the new one outranks, then the one that left
+        start = index - self.count + 1
+        smallest, largest = self._min, self._max
+        while smallest and buffer[smallest[-1]] >= value:
+            smallest.pop()
+        smallest.append(index)
+        if smallest[0] < start:
+            smallest.popleft()
+        while largest and buffer[largest[-1]] <= value:
+            largest.pop()
+        largest.append(index)
+        if largest[0] < start:
+            largest.popleft()
+
+    def _resum(self, index: int) -> None:
+        """Recompute the sums exactly from the samples in the window."""
+        values = [self._buffer[i] for i in range(index - self.count + 1, index + 1)]
+        self._sum = math.fsum(values)
+        self._weighted = math.fsum(position * value for position, value in enumerate(values))
+
+    @property
+    def mean(self) -> float | None:
+        """Return the mean of the window."""
+        return self._sum / self.count if self.count else None
+
+    @property
+    def minimum(self) -> float | None:
+        """Return the smallest sample in the window."""
+        return self._buffer[self._min[0]] if self.count else None
+
+    @property
+    def maximum(self) -> float | None:
+        """Return the largest sample in the window."""
+        return self._buffer[self._max[0]] if self.count else None
+
+    @property
+    def slope(self) -> float | None:
+        """Return the least-squares slope of the window, per sample."""
+        count = self.count
+        if count < 2:
+            return None
+        sum_x = count * (count - 1) / 2
+        sum_xx = (count - 1) * count * (2 * count - 1) / 6
+        return (count * self._weighted - sum_x * self._sum) / (count * sum_xx - sum_x * sum_x)
+
+
+class FrixosLuxSampler:
+    """Sample a device's light level from its status between regular polls.
+
+    Only the status endpoint is fetched, on the request lane behind writes
+    and refreshes. Samples stay in memory in a ring buffer sized for the
+    longest window; listeners (the statistic sensors) are notified at most
+    every LUX_PUBLISH_INTERVAL seconds, so only the statistics become states.
+    """
+
+    def __init__(
+        self,
+        coordinator: FrixosDataUpdateCoordinator,
+        interval: float,
+        windows: Iterable[int],
+    ) -> None:
+        """Initialize a sampler taking a sample every interval seconds."""
+        self._coordinator = coordinator
+        self.interval = interval
+        lengths = {window: max(1, round(window / interval)) for window in windows}
+        # One spare slot keeps the sample leaving the longest window readable
+        self._buffer = SampleBuffer(max(lengths.values()) + 1)
+        self.windows = {
+            window: RollingWindow(length, self._buffer) for window, length in lengths.items()
+        }
+        self._publish_every = max(1, round(LUX_PUBLISH_INTERVAL / interval))
+        self._listeners: list[CALLBACK_TYPE] = []
+        self._unsub: CALLBACK_TYPE | None = None
+        self._sampling = False
+        self.last: float | None = None
+        self.failed = 0
+        self.skipped = 0
+
+    @property
+    def samples(self) -> int:
+        """Return the number of samples taken."""
+        return self._buffer.count
+
+    def trend(self, window: int) -> float | None:
+        """Return the light level trend over window in lux per minute."""
+        slope = self.windows[window].slope
+        return None if slope is None else slope * 60 / self.interval
+
+    @callback
+    def async_add_listener(self, update_callback: CALLBACK_TYPE) -> Callable[[], None]:
+        """Listen for new statistics."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            """Remove the listener."""
+            self._listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def async_start(self) -> None:
+        """Start sampling."""
+        if self._unsub is None:
+            self._unsub = async_track_time_interval(
+                self._coordinator.hass, self._async_sample, timedelta(seconds=self.interval)
+            )
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop sampling."""
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+
+    async def _async_sample(self, _now: Any = None) -> None:
+        """Fetch the status and add its light level as a sample."""
+        if self._sampling or not self._coordinator.breaker.is_closed:
+            # The previous sample is still in flight, or the device is away
+            self.skipped += 1
+            return
+        self._sampling = True
+        try:
+            status = await self._coordinator.async_fetch_status()
+        except UpdateFailed as err:
+            self.failed += 1
+            _LOGGER.debug("Light level sample from %s failed: %s", self._coordinator.host, err)
+            return
+        finally:
+            self._sampling = False
+        try:
+            value = float(status["lux"])
+        except (KeyError, TypeError, ValueError):
+            self.failed += 1
+            return
+        self.add(value)
+
+    @callback
+    def add(self, value: float) -> None:
+        """Add a sample and notify listeners when the statistics are due."""
+        index = self._buffer.append(value)
+        for window in self.windows.values():
+            window.add(index)
+        self.last = value
+        if index % self._publish_every == 0:
+            for update_callback in list(self._listeners):
+                update_callback()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return sampler state for diagnostics."""
+        return {
+            "interval": self.interval,
+            "windows": {
+                window: {"samples": rolling.length, "filled": rolling.count}
+                for window, rolling in self.windows.items()
+            },
+            "samples": self.samples,
+            "failed": self.failed,
+            "skipped": self.skipped,
+            "last": self.last,
+        }
@@ -0,0 +1,71 @@
+"""Fleet-wide poll scheduling for the Frixos integration."""
+from __future__ import annotations
+
+import asyncio
+import time
+import zlib
+from datetime import timedelta
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import (
+    CONF_MAX_CONCURRENT_POLLS,
+    DATA_CONFIG,
+    DATA_SCHEDULER,
+    DEFAULT_MAX_CONCURRENT_POLLS,
+    DOMAIN,
+    POLL_SLOT_TOLERANCE,
+)
+
+
+class FrixosPollScheduler:
+    """Spread device polls over the poll interval and cap polls in flight.
+
+    Each host gets a deterministic phase within the interval, so after a
+    restart devices are polled one after another instead of in lockstep.
+    Polls always move forward to a slot: a device near its poll floor waits
+    for a later slot rather than being polled early or off its phase.
+    """
+
+    def __init__(self, max_concurrent: int) -> None:
+        """Initialize the scheduler."""
+        self.semaphore = asyncio.Semaphore(max_concurrent)
+
+    @staticmethod
+    def phase(host: str) -> float:
+        """Return the host's fixed position in the poll cycle, in [0, 1)."""
+        return zlib.crc32(host.encode()) / 0x100000000
+
+    def next_interval(
+        self, host: str, interval: float, floor: float = 0, started: float | None = None
+    ) -> timedelta:
+        """Return the delay until the host's next slot in the poll cycle.
+
+        The delay usually lies between half and one and a half intervals, so
+        the average rate matches the requested interval. Slots closer than floor
+        (the device's fastest poll interval) to the start of the poll just
+        made, a time.time() value, are skipped, so the device is never
+        polled faster than that even right after its interval changed.
+        """
+        now = time.time()
+        offset = self.phase(host) * interval
+        delay = interval - ((now - offset) % interval)
+        if delay < interval / 2:
+            delay += interval
+        elapsed = 0.0 if started is None else now - started
+        while elapsed + delay < floor - POLL_SLOT_TOLERANCE:
+            delay += interval
+        return timedelta(seconds=delay)
+
+
+@callback
+def async_get_scheduler(hass: HomeAssistant) -> FrixosPollScheduler:
+    """Return the poll scheduler shared by all Frixos devices."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    scheduler: FrixosPollScheduler | None = domain_data.get(DATA_SCHEDULER)
+    if scheduler is None:
+        max_concurrent = domain_data.get(DATA_CONFIG, {}).get(
+            CONF_MAX_CONCURRENT_POLLS, DEFAULT_MAX_CONCURRENT_POLLS
+        )
+        scheduler = domain_data[DATA_SCHEDULER] = FrixosPollScheduler(max_concurrent)
+    return scheduler
@@ -25,7 +25,7 @@ from .const import (
     LANGUAGE_OPTIONS,
 )
 from .coordinator import FrixosDataUpdateCoordinator
-from .entity import FrixosEntity
+from .entity import FrixosEntity, FrixosValueSpec
 
 SELECT_DESCRIPTIONS: tuple[SelectEntityDescription, ...] = (
     SelectEntityDescription(
@@ -76,6 +76,8 @@ SELECT_DESCRIPTIONS: tuple[SelectEntityDescription, ...] = (
         icon="mdi:map-marker",
         options=list(DEXCOM_REGION_OPTIONS.values()),
         entity_category=EntityCategory.CONFIG,
+        # Only used with the Dexcom feature
+        entity_registry_enabled_default=False,
     ),
     SelectEntityDescription(
         key=PARAM_LANGUAGE,
@@ -86,6 +88,35 @@ SELECT_DESCRIPTIONS: tuple[SelectEntityDescription, ...] = (
     ),
 )
 
+# Map each description to its options mapping
+SELECT_OPTION_MAPS: dict[str, dict[int, str] | None] = {
+    PARAM_ROTATION: ROTATION_OPTIONS,
+    PARAM_DAY_FONT: None,  # String value, no mapping
+    PARAM_NIGHT_FONT: None,  # String value, no mapping
+    PARAM_COLOR_FILTER: COLOR_FILTER_OPTIONS,
+    PARAM_NIGHT_COLOR_FILTER: COLOR_FILTER_OPTIONS,
+    PARAM_MSG_FONT: MSG_FONT_OPTIONS,
+    PARAM_DEXCOM_REGION: DEXCOM_REGION_OPTIONS,
+    PARAM_LANGUAGE: LANGUAGE_OPTIONS,
+}
+
+
+def _compile_spec(key: str) -> FrixosValueSpec:
+    """Return the value spec for a select description key."""
+    options_map = SELECT_OPTION_MAPS[key]
+    if options_map:
+        return FrixosValueSpec(
+            key, options=options_map, convert=lambda value: options_map.get(int(value))
+        )
+    # Otherwise, return the value as-is (for string values like fonts)
+    return FrixosValueSpec(key, convert=lambda value: str(value) if value else None)
+
+
+SELECT_SPECS: dict[str, FrixosValueSpec] = {
+    description.key: _compile_spec(description.key)
+    for description in SELECT_DESCRIPTIONS
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -95,21 +126,10 @@ async def async_setup_entry(
     """Set up Frixos select entities."""
     coordinator: FrixosDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    # Map each description to its options mapping
-    mappings = {
-        PARAM_ROTATION: ROTATION_OPTIONS,
-        PARAM_DAY_FONT: None,  # String value, no mapping
-        PARAM_NIGHT_FONT: None,  # String value, no mapping
-        PARAM_COLOR_FILTER: COLOR_FILTER_OPTIONS,
-        PARAM_NIGHT_COLOR_FILTER: COLOR_FILTER_OPTIONS,
-        PARAM_MSG_FONT: MSG_FONT_OPTIONS,
-        PARAM_DEXCOM_REGION: DEXCOM_REGION_OPTIONS,
-        PARAM_LANGUAGE: LANGUAGE_OPTIONS,
-    }
-
     entities = [
-        FrixosSelect(coordinator, description, mappings[description.key])
+        FrixosSelect(coordinator, description)
         for description in SELECT_DESCRIPTIONS
+        if SELECT_SPECS[description.key].present(coordinator.data)
     ]
 
     async_add_entities(entities)
@@ -122,57 +142,35 @@ class FrixosSelect(FrixosEntity, SelectEntity):
         self,
         coordinator: FrixosDataUpdateCoordinator,
         description: SelectEntityDescription,
-        options_map: dict[int, str] | None,
     ) -> None:
         """Initialize the select entity."""
+        self._spec = SELECT_SPECS[description.key]
         super().__init__(
             coordinator,
             f"{coordinator.host}_{description.key}",
             description.name,
             description.icon,
+            (description.key,),
         )
         self.entity_description = description
         self._param_key = description.key
-        self._options_map = options_map
 
     @property
     def current_option(self) -> str | None:
         """Return the selected option."""
-        if not self.coordinator.data or not isinstance(self.coordinator.data, dict):
-            return None
-        
-        settings = self.coordinator.data.get("settings", {})
-        if not isinstance(settings, dict):
-            return None
-        
-        value = settings.get(self._param_key)
-        
-        if value is None:
-            return None
-        
-        # If we have a mapping (for numeric values), use it
-        if self._options_map:
-            try:
-                return self._options_map.get(int(value))
-            except (ValueError, TypeError):
-                return None
-        
-        # Otherwise, return the value as-is (for string values like fonts)
-        return str(value) if value else None
+        return self._spec.read(self.coordinator.snapshot)
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
-        # If we have a mapping, find the key for the option
-        if self._options_map:
-            # Find key by value
-            for key, val in self._options_map.items():
-                if val == option:
-                    success = await self.coordinator.async_set_setting(self._param_key, key)
-                    if success:
-                        self.async_write_ha_state()
-                    return
+        # If we have a mapping, look up the device value for the option
+        if self._spec.reverse is not None:
+            if option not in self._spec.reverse:
+                return
+            value = self._spec.reverse[option]
         else:
             # For string values (fonts), use the option directly
-            success = await self.coordinator.async_set_setting(self._param_key, option)
-            if success:
-                self.async_write_ha_state()
+            value = option
+
+        success = await self.coordinator.async_set_setting(self._param_key, value)
+        if success:
+            self.async_write_ha_state()
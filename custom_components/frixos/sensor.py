@@ -1,15 +1,25 @@
 """Sensor platform for Frixos integration."""
 from __future__ import annotations
 
-from homeassistant.components.sensor import SensorEntity, SensorEntityDescription
+from collections.abc import Callable
+from typing import Any
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import PERCENTAGE, UnitOfTime
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN
+from .const import BREAKER_CLOSED, BREAKER_HALF_OPEN, BREAKER_OPEN, DOMAIN
 from .coordinator import FrixosDataUpdateCoordinator
-from .entity import FrixosEntity
+from .entity import FrixosEntity, FrixosValueSpec
+from .sampler import FrixosLuxSampler
 
 SENSOR_DESCRIPTIONS: tuple[SensorEntityDescription, ...] = (
     SensorEntityDescription(
@@ -42,6 +52,139 @@ SENSOR_DESCRIPTIONS: tuple[SensorEntityDescription, ...] = (
     ),
 )
 
+SENSOR_SPECS: dict[str, FrixosValueSpec] = {
+    description.key: FrixosValueSpec(description.key, section="status")
+    for description in SENSOR_DESCRIPTIONS
+}
+
+# Sensors reporting coordinator state rather than device status
+DIAGNOSTIC_SENSOR_DESCRIPTIONS: tuple[SensorEntityDescription, ...] = (
+    SensorEntityDescription(
+        key="poll_interval",
+        name="Poll Interval",
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        icon="mdi:timer-sync-outline",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    SensorEntityDescription(
+        key="poll_latency_p50",
+        name="Poll Latency (Median)",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:timer-outline",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    SensorEntityDescription(
+        key="poll_latency_p95",
+        name="Poll Latency (95th Percentile)",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:timer-alert-outline",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    SensorEntityDescription(
+        key="write_latency_p50",
+        name="Write Latency (Median)",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:timer-outline",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    SensorEntityDescription(
+        key="write_latency_p95",
+        name="Write Latency (95th Percentile)",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:timer-alert-outline",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    SensorEntityDescription(
+        key="error_rate",
+        name="Request Error Rate",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:alert-circle-outline",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    SensorEntityDescription(
+        key="circuit_breaker",
+        name="Circuit Breaker",
+        device_class=SensorDeviceClass.ENUM,
+        options=[BREAKER_CLOSED, BREAKER_OPEN, BREAKER_HALF_OPEN],
+        icon="mdi:electric-switch",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    SensorEntityDescription(
+        key="message_queue",
+        name="Message Queue",
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:message-processing-outline",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    SensorEntityDescription(
+        key="messages_dropped",
+        name="Messages Dropped",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        icon="mdi:message-alert-outline",
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+)
+
+# Map each diagnostic description to the coordinator value it reports
+DIAGNOSTIC_VALUES: dict[str, Callable[[FrixosDataUpdateCoordinator], Any]] = {
+    "poll_interval": lambda coordinator: coordinator.poll_interval,
+    "poll_latency_p50": lambda coordinator: coordinator.metrics.latency_percentile("poll", 50),
+    "poll_latency_p95": lambda coordinator: coordinator.metrics.latency_percentile("poll", 95),
+    "write_latency_p50": lambda coordinator: coordinator.metrics.latency_percentile("write", 50),
+    "write_latency_p95": lambda coordinator: coordinator.metrics.latency_percentile("write", 95),
+    "error_rate": lambda coordinator: coordinator.metrics.error_rate,
+    "circuit_breaker": lambda coordinator: coordinator.breaker.state,
+    "message_queue": lambda coordinator: coordinator.messages.depth,
+    "messages_dropped": lambda coordinator: (
+        coordinator.messages.dropped + coordinator.messages.failed
+    ),
+}
+
+
+# Rolling light level statistics: name, unit, icon and value per window
+LuxStatisticValue = Callable[[FrixosLuxSampler, int], float | None]
+LUX_STATISTICS: dict[str, tuple[str, str, str, LuxStatisticValue]] = {
+    "mean": (
+        "Mean",
+        "lx",
+        "mdi:brightness-6",
+        lambda sampler, window: sampler.windows[window].mean,
+    ),
+    "min": (
+        "Min",
+        "lx",
+        "mdi:brightness-4",
+        lambda sampler, window: sampler.windows[window].minimum,
+    ),
+    "max": (
+        "Max",
+        "lx",
+        "mdi:brightness-7",
+        lambda sampler, window: sampler.windows[window].maximum,
+    ),
+    "trend": (
+        "Trend",
+        "lx/min",
+        "mdi:trending-up",
+        lambda sampler, window: sampler.trend(window),
+    ),
+}
+
+
+def _window_label(window: int) -> str:
+    """Return a window length such as "5 min" or "90 s"."""
+    return f"{window // 60} min" if window % 60 == 0 else f"{window} s"
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -54,7 +197,19 @@ async def async_setup_entry(
     entities = [
         FrixosSensor(coordinator, description)
         for description in SENSOR_DESCRIPTIONS
+        if SENSOR_SPECS[description.key].present(coordinator.data)
     ]
+    entities.extend(
+        FrixosDiagnosticSensor(coordinator, description)
+        for description in DIAGNOSTIC_SENSOR_DESCRIPTIONS
+    )
+    sampler = coordinator.lux_sampler
+    if sampler is not None and SENSOR_SPECS["lux"].present(coordinator.data):
+        entities.extend(
+            FrixosLuxStatisticSensor(coordinator, sampler, window, statistic)
+            for window in sampler.windows
+            for statistic in LUX_STATISTICS
+        )
 
     async_add_entities(entities)
 
@@ -68,28 +223,96 @@ class FrixosSensor(FrixosEntity, SensorEntity):
         description: SensorEntityDescription,
     ) -> None:
         """Initialize the sensor."""
+        # Diagnostic sensors report coordinator state and have no spec
+        self._spec = SENSOR_SPECS.get(description.key)
         super().__init__(
             coordinator,
             f"{coordinator.host}_{description.key}",
             description.name,
             description.icon,
+            (description.key,),
         )
         self.entity_description = description
 
     @property
     def native_value(self) -> float | int | str | None:
         """Return the state of the sensor."""
-        if not self.coordinator.data or not isinstance(self.coordinator.data, dict):
-            return None
-        
-        status = self.coordinator.data.get("status", {})
-        if not isinstance(status, dict):
-            return None
-        
-        value = status.get(self.entity_description.key)
-        return value
+        return self._spec.read(self.coordinator.snapshot)
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
         return self.coordinator.last_update_success
+
+
+class FrixosDiagnosticSensor(FrixosSensor):
+    """Representation of a Frixos coordinator diagnostic sensor."""
+
+    def __init__(
+        self,
+        coordinator: FrixosDataUpdateCoordinator,
+        description: SensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, description)
+        # Coordinator state is not tied to a device key, update on every poll
+        self.coordinator_context = None
+
+    @property
+    def native_value(self) -> float | int | str | None:
+        """Return the coordinator value for this description."""
+        return DIAGNOSTIC_VALUES[self.entity_description.key](self.coordinator)
+
+    @property
+    def available(self) -> bool:
+        """Return True, coordinator state is known even when the device is not."""
+        return True
+
+
+class FrixosLuxStatisticSensor(FrixosEntity, SensorEntity):
+    """Rolling light level statistic over one window of the lux sampler."""
+
+    def __init__(
+        self,
+        coordinator: FrixosDataUpdateCoordinator,
+        sampler: FrixosLuxSampler,
+        window: int,
+        statistic: str,
+    ) -> None:
+        """Initialize the sensor."""
+        label, unit, icon, self._value = LUX_STATISTICS[statistic]
+        description = SensorEntityDescription(
+            key=f"lux_{statistic}_{window}",
+            name=f"Light Level {label} ({_window_label(window)})",
+            native_unit_of_measurement=unit,
+            state_class=SensorStateClass.MEASUREMENT,
+            icon=icon,
+        )
+        # Updated by the sampler; the coordinator only reports availability
+        super().__init__(
+            coordinator,
+            f"{coordinator.host}_{description.key}",
+            description.name,
+            description.icon,
+            (),
+        )
+        self.entity_description = description
+        self._sampler = sampler
+        self._window = window
+
+    async def async_added_to_hass(self) -> None:
+        """Write state whenever the sampler publishes new statistics."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._sampler.async_add_listener(self.async_write_ha_state))
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the statistic, rounded like the raw light level."""
+        value = self._value(self._sampler, self._window)
+        # Unchanged rounded values are not recorded again
+        return None if value is None else round(value, 1)
+
+    @property
+    def available(self) -> bool:
+        """Return True once the window holds a sample and the device responds."""
+        return self.coordinator.last_update_success and self._sampler.samples > 0
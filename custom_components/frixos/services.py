@@ -0,0 +1,280 @@
+"""Services for the Frixos integration."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable, Mapping
+import logging
+import re
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.const import ATTR_AREA_ID, ATTR_DEVICE_ID, ATTR_ENTITY_ID
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import HomeAssistantError
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.service import async_extract_config_entry_ids
+
+from .const import (
+    BROADCAST_ATTEMPTS,
+    BROADCAST_CONCURRENCY,
+    BROADCAST_RETRY_DELAY,
+    DOMAIN,
+)
+from .coordinator import FrixosDataUpdateCoordinator
+from .presets import async_get_presets, capture_preset, preset_diff
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_APPLY_PRESET = "apply_preset"
+SERVICE_SAVE_PRESET = "save_preset"
+SERVICE_SET_SETTINGS = "set_settings"
+SERVICE_SHOW_MESSAGE = "show_message"
+
+ATTR_ALLOW_RESTART = "allow_restart"
+ATTR_COLOR = "color"
+ATTR_FORCE = "force"
+ATTR_MESSAGE = "message"
+ATTR_NAME = "name"
+ATTR_NIGHT_COLOR = "night_color"
+ATTR_PARAMS = "params"
+ATTR_SETTINGS = "settings"
+ATTR_TAG = "tag"
+
+PARAM_KEY = re.compile(r"^p\d{2}$")
+
+SHOW_MESSAGE_SCHEMA = vol.Schema(
+    {
+        **cv.ENTITY_SERVICE_FIELDS,
+        vol.Required(ATTR_MESSAGE): cv.string,
+        vol.Optional(ATTR_COLOR): cv.string,
+        vol.Optional(ATTR_NIGHT_COLOR): cv.string,
+        vol.Optional(ATTR_TAG): cv.string,
+    }
+)
+
+SET_SETTINGS_SCHEMA = vol.Schema(
+    {
+        **cv.ENTITY_SERVICE_FIELDS,
+        vol.Required(ATTR_SETTINGS): vol.All(
+            {vol.Match(PARAM_KEY): vol.Any(str, int, float, bool, list)},
+            vol.Length(min=1),
+        ),
+        vol.Optional(ATTR_FORCE, default=False): cv.boolean,
+    }
+)
+
+SAVE_PRESET_SCHEMA = vol.Schema(
+    {
+        **cv.ENTITY_SERVICE_FIELDS,
+        vol.Required(ATTR_NAME): cv.string,
+        vol.Optional(ATTR_PARAMS): vol.All(cv.ensure_list, [vol.Match(PARAM_KEY)]),
+    }
+)
+
+APPLY_PRESET_SCHEMA = vol.Schema(
+    {
+        **cv.ENTITY_SERVICE_FIELDS,
+        vol.Required(ATTR_NAME): cv.string,
+        vol.Optional(ATTR_ALLOW_RESTART, default=False): cv.boolean,
+    }
+)
+
+
+async def async_get_target_coordinators(
+    hass: HomeAssistant, call: ServiceCall, default_all: bool = False
+) -> list[FrixosDataUpdateCoordinator]:
+    """Return the coordinators of the Frixos devices a service call targets.
+
+    With default_all, a call without any target addresses every device.
+    """
+    domain_data = hass.data.get(DOMAIN, {})
+    if default_all and not any(
+        call.data.get(field) for field in (ATTR_AREA_ID, ATTR_DEVICE_ID, ATTR_ENTITY_ID)
+    ):
+        entry_ids: Iterable[str] = domain_data
+    else:
+        entry_ids = await async_extract_config_entry_ids(hass, call)
+    coordinators = [
+        coordinator
+        for entry_id in entry_ids
+        if isinstance(coordinator := domain_data.get(entry_id), FrixosDataUpdateCoordinator)
+    ]
+    if not coordinators:
+        raise HomeAssistantError("No loaded Frixos device matches the service target")
+    return coordinators
+
+
+async def async_broadcast_settings(
+    coordinators: Iterable[FrixosDataUpdateCoordinator],
+    values: dict[str, Any],
+    concurrency: int = BROADCAST_CONCURRENCY,
+    attempts: int = BROADCAST_ATTEMPTS,
+    retry_delay: float = BROADCAST_RETRY_DELAY,
+    force: bool = False,
+) -> dict[str, dict[str, Any]]:
+    """Write the same settings to many devices at once."""
+    return await async_write_settings(
+        {coordinator: values for coordinator in coordinators},
+        concurrency,
+        attempts,
+        retry_delay,
+        force,
+    )
+
+
+async def async_write_settings(
+    writes: Mapping[FrixosDataUpdateCoordinator, dict[str, Any]],
+    concurrency: int = BROADCAST_CONCURRENCY,
+    attempts: int = BROADCAST_ATTEMPTS,
+    retry_delay: float = BROADCAST_RETRY_DELAY,
+    force: bool = False,
+) -> dict[str, dict[str, Any]]:
+    """Write settings to many devices at once, each with its own values.
+
+    At most concurrency devices are written at a time. Devices whose write
+    failed are retried, up to attempts tries in total. Returns the outcome
+    and number of tries per device, keyed by host:port. Values a device
+    already has are not sent unless force is set.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    results: dict[str, dict[str, Any]] = {}
+
+    async def write(coordinator: FrixosDataUpdateCoordinator) -> bool:
+        async with semaphore:
+            return await coordinator.async_set_settings(dict(writes[coordinator]), force)
+
+    pending = list(writes)
+    for attempt in range(1, attempts + 1):
+        if attempt > 1:
+            await asyncio.sleep(retry_delay)
+        outcomes = await asyncio.gather(
+            *(write(coordinator) for coordinator in pending), return_exceptions=True
+        )
+        failed = []
+        for coordinator, outcome in zip(pending, outcomes):
+            if isinstance(outcome, Exception):
+                _LOGGER.error("Error writing settings to %s: %s", coordinator.host, outcome)
+            success = outcome is True
+            results[f"{coordinator.host}:{coordinator.port}"] = {
+                "success": success,
+                "attempts": attempt,
+            }
+            if not success:
+                failed.append(coordinator)
+        if not failed:
+            break
+        pending = failed
+
+    return results
+
+
+async def _async_show_message(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Queue a scrolling message on the targeted devices."""
+    for coordinator in await async_get_target_coordinators(hass, call):
+        coordinator.messages.async_push(
+            call.data[ATTR_MESSAGE],
+            call.data.get(ATTR_COLOR),
+            call.data.get(ATTR_NIGHT_COLOR),
+            call.data.get(ATTR_TAG),
+        )
+
+
+async def _async_set_settings(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Write settings to the targeted devices, or all devices without a target."""
+    coordinators = await async_get_target_coordinators(hass, call, default_all=True)
+    results = await async_broadcast_settings(
+        coordinators, call.data[ATTR_SETTINGS], force=call.data[ATTR_FORCE]
+    )
+    succeeded = sum(1 for result in results.values() if result["success"])
+    if succeeded < len(results):
+        _LOGGER.warning(
+            "Settings %s written to %d of %d devices",
+            ", ".join(call.data[ATTR_SETTINGS]),
+            succeeded,
+            len(results),
+        )
+    return {
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+        "devices": results,
+    }
+
+
+async def _async_save_preset(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Store the targeted device's current settings as a named preset."""
+    coordinators = await async_get_target_coordinators(hass, call)
+    if len(coordinators) > 1:
+        raise HomeAssistantError("Target exactly one Frixos device to save a preset from")
+    values = capture_preset(coordinators[0], call.data.get(ATTR_PARAMS))
+    if not values:
+        raise HomeAssistantError(f"No settings of {coordinators[0].host} to save yet")
+    await async_get_presets(hass).async_save(call.data[ATTR_NAME], values)
+
+
+async def _async_apply_preset(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Send each targeted device the preset settings it does not have yet."""
+    name = call.data[ATTR_NAME]
+    preset = await async_get_presets(hass).async_get(name)
+    if preset is None:
+        raise HomeAssistantError(f"Unknown Frixos preset: {name}")
+
+    coordinators = await async_get_target_coordinators(hass, call)
+    diffs = {
+        coordinator: preset_diff(coordinator, preset, call.data[ATTR_ALLOW_RESTART])
+        for coordinator in coordinators
+    }
+    # Devices already matching the preset are not contacted at all
+    results = await async_write_settings(
+        {coordinator: diff for coordinator, (diff, _) in diffs.items() if diff}
+    )
+    devices = {}
+    for coordinator, (diff, skipped) in diffs.items():
+        key = f"{coordinator.host}:{coordinator.port}"
+        result = results.get(key, {"success": True, "attempts": 0})
+        devices[key] = {**result, "changed": sorted(diff), "skipped": skipped}
+    return {"preset": name, "devices": devices}
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the Frixos services."""
+
+    async def show_message(call: ServiceCall) -> None:
+        await _async_show_message(hass, call)
+
+    async def set_settings(call: ServiceCall) -> ServiceResponse:
+        return await _async_set_settings(hass, call)
+
+    async def save_preset(call: ServiceCall) -> None:
+        await _async_save_preset(hass, call)
+
+    async def apply_preset(call: ServiceCall) -> ServiceResponse:
+        return await _async_apply_preset(hass, call)
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_SHOW_MESSAGE, show_message, schema=SHOW_MESSAGE_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_SAVE_PRESET, save_preset, schema=SAVE_PRESET_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_APPLY_PRESET,
+        apply_preset,
+        schema=APPLY_PRESET_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_SETTINGS,
+        set_settings,
+        schema=SET_SETTINGS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
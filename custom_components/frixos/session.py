@@ -0,0 +1,67 @@
+"""Shared HTTP session for the Frixos integration."""
+from __future__ import annotations
+
+import aiohttp
+
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant, callback
+
+from .const import (
+    CONF_CONNECTION_LIMIT,
+    CONNECTION_KEEPALIVE,
+    DATA_CONFIG,
+    DATA_SESSION,
+    DATA_SESSION_UNSUB,
+    DEFAULT_CONNECTION_LIMIT,
+    DNS_CACHE_TTL,
+    DOMAIN,
+)
+
+
+@callback
+def async_get_session(hass: HomeAssistant) -> aiohttp.ClientSession:
+    """Return the session shared by all Frixos devices, creating it if needed.
+
+    The ESP web server handles a single connection at a time, so the
+    connector keeps at most one keep-alive connection open per device.
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    session: aiohttp.ClientSession | None = domain_data.get(DATA_SESSION)
+    if session is not None and not session.closed:
+        return session
+
+    limit = domain_data.get(DATA_CONFIG, {}).get(
+        CONF_CONNECTION_LIMIT, DEFAULT_CONNECTION_LIMIT
+    )
+    connector = aiohttp.TCPConnector(
+        limit=limit,
+        limit_per_host=1,
+        ttl_dns_cache=DNS_CACHE_TTL,
+        keepalive_timeout=CONNECTION_KEEPALIVE,
+    )
+    session = aiohttp.ClientSession(connector=connector)
+    domain_data[DATA_SESSION] = session
+    if (unsub := domain_data.pop(DATA_SESSION_UNSUB, None)) is not None:
+        unsub()
+
+    async def _async_close_session(event: Event) -> None:
+        """Close the session when Home Assistant stops."""
+        # A fired one-time listener must not be removed again
+        domain_data.pop(DATA_SESSION_UNSUB, None)
+        await session.close()
+
+    # Removed with the session, so re-creating it does not stack listeners
+    domain_data[DATA_SESSION_UNSUB] = hass.bus.async_listen_once(
+        EVENT_HOMEASSISTANT_CLOSE, _async_close_session
+    )
+    return session
+
+
+async def async_close_session(hass: HomeAssistant) -> None:
+    """Close the shared session once no device uses it any more."""
+    domain_data = hass.data.get(DOMAIN, {})
+    session: aiohttp.ClientSession | None = domain_data.pop(DATA_SESSION, None)
+    if (unsub := domain_data.pop(DATA_SESSION_UNSUB, None)) is not None:
+        unsub()
+    if session is not None:
+        await session.close()
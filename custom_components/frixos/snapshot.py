@@ -0,0 +1,64 @@
+"""Per-poll snapshot of converted Frixos values."""
+from __future__ import annotations
+
+from collections.abc import Collection, Mapping
+from typing import TYPE_CHECKING, Any
+
+from .const import COLOR_PARAMS
+from .values import color_to_rgb
+
+if TYPE_CHECKING:
+    from .entity import FrixosValueSpec
+
+
+class FrixosSnapshot:
+    """One poll's data with every value entities read already converted.
+
+    Built by the coordinator whenever the data changed, so a state write
+    is a dict lookup instead of converting the raw JSON value again.
+    Values are never changed afterwards; an entity added later only has
+    its value added.
+    """
+
+    __slots__ = ("data", "values", "version", "rgb")
+
+    def __init__(
+        self,
+        data: dict[str, Any] | None,
+        specs: Mapping[str, Collection[FrixosValueSpec]],
+        previous: FrixosSnapshot | None = None,
+        changed: Collection[str] | None = None,
+    ) -> None:
+        """Convert the values of specs, grouped by the key they read, from data.
+
+        Given the previous snapshot and the keys changed since, only the
+        values read from those keys are converted again.
+        """
+        self.data = data
+        status = data.get("status") if isinstance(data, dict) else None
+        settings = data.get("settings") if isinstance(data, dict) else None
+        if previous is None or changed is None:
+            changed = None
+            self.values: dict[FrixosValueSpec, Any] = {}
+            self.rgb: dict[str, tuple[int, int, int] | None] = {}
+        else:
+            self.values = dict(previous.values)
+            self.rgb = dict(previous.rgb)
+            self.version: Any = previous.version
+
+        for key in specs if changed is None else changed:
+            for spec in specs.get(key, ()):
+                self.values[spec] = spec.extract(data)
+        if changed is None or "version" in changed:
+            self.version = (
+                status.get("version", "Unknown") if isinstance(status, dict) else "Unknown"
+            )
+        if isinstance(settings, dict):
+            for param in COLOR_PARAMS:
+                if changed is None or param in changed:
+                    self.rgb[param] = color_to_rgb(settings.get(param))
+
+    def add(self, spec: FrixosValueSpec) -> None:
+        """Convert the value of a newly tracked spec."""
+        if spec not in self.values:
+            self.values[spec] = spec.extract(self.data)
@@ -20,7 +20,7 @@ from .const import (
     PARAM_UPDATE_FIRMWARE,
 )
 from .coordinator import FrixosDataUpdateCoordinator
-from .entity import FrixosEntity
+from .entity import FrixosEntity, FrixosValueSpec
 
 SWITCH_DESCRIPTIONS: tuple[SwitchEntityDescription, ...] = (
     SwitchEntityDescription(
@@ -80,6 +80,12 @@ SWITCH_DESCRIPTIONS: tuple[SwitchEntityDescription, ...] = (
 )
 
 
+SWITCH_SPECS: dict[str, FrixosValueSpec] = {
+    description.key: FrixosValueSpec(description.key, convert=bool)
+    for description in SWITCH_DESCRIPTIONS
+}
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -91,6 +97,7 @@ async def async_setup_entry(
     entities = [
         FrixosSwitch(coordinator, description)
         for description in SWITCH_DESCRIPTIONS
+        if SWITCH_SPECS[description.key].present(coordinator.data)
     ]
 
     async_add_entities(entities)
@@ -105,26 +112,20 @@ class FrixosSwitch(FrixosEntity, SwitchEntity):
         description: SwitchEntityDescription,
     ) -> None:
         """Initialize the switch."""
+        self._spec = SWITCH_SPECS[description.key]
         super().__init__(
             coordinator,
             f"{coordinator.host}_{description.key}",
             description.name,
             description.icon,
+            (description.key,),
         )
         self.entity_description = description
 
     @property
     def is_on(self) -> bool | None:
         """Return if the switch is turned on."""
-        if not self.coordinator.data or not isinstance(self.coordinator.data, dict):
-            return None
-        
-        settings = self.coordinator.data.get("settings", {})
-        if not isinstance(settings, dict):
-            return None
-        
-        value = settings.get(self.entity_description.key)
-        return bool(value) if value is not None else None
+        return self._spec.read(self.coordinator.snapshot)
 
     async def async_turn_on(self, **kwargs) -> None:
         """Turn the switch on."""
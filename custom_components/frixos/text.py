@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from homeassistant.components.text import TextEntity, TextEntityDescription
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import MAX_LENGTH_STATE_STATE
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -18,11 +19,13 @@ from .const import (
     PASSWORD_PARAMS,
 )
 from .coordinator import FrixosDataUpdateCoordinator
-from .entity import FrixosEntity
+from .entity import FrixosEntity, FrixosValueSpec
+from .values import normalize_color
 
 # Map parameter keys to their max lengths
 TEXT_MAX_LENGTHS = {
-    PARAM_MESSAGE: 511,
+    # The device takes 511 bytes (frixos.show_message), a state only 255
+    PARAM_MESSAGE: MAX_LENGTH_STATE_STATE,
     PARAM_LATITUDE: 12,
     PARAM_LONGITUDE: 12,
     PARAM_TIMEZONE: 64,
@@ -70,6 +73,20 @@ TEXT_DESCRIPTIONS: tuple[TextEntityDescription, ...] = (
 )
 
 
+TEXT_SPECS: dict[str, FrixosValueSpec] = {
+    description.key: FrixosValueSpec(
+        description.key,
+        # Normalize color values when reading
+        convert=(
+            (lambda value: normalize_color(str(value)))
+            if description.key in (PARAM_MSG_COLOR, PARAM_NIGHT_MSG_COLOR)
+            else str
+        ),
+    )
+    for description in TEXT_DESCRIPTIONS
+}
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -81,6 +98,7 @@ async def async_setup_entry(
     entities = [
         FrixosText(coordinator, description)
         for description in TEXT_DESCRIPTIONS
+        if TEXT_SPECS[description.key].present(coordinator.data)
     ]
 
     async_add_entities(entities)
@@ -95,16 +113,18 @@ class FrixosText(FrixosEntity, TextEntity):
         description: TextEntityDescription,
     ) -> None:
         """Initialize the text entity."""
+        self._spec = TEXT_SPECS[description.key]
         super().__init__(
             coordinator,
             f"{coordinator.host}_{description.key}",
             description.name,
             description.icon,
+            (description.key,),
         )
         self.entity_description = description
         self._attr_native_min = 0
         # Get max length from our mapping
-        self._attr_native_max = TEXT_MAX_LENGTHS.get(description.key, 255)
+        self._attr_native_max = TEXT_MAX_LENGTHS.get(description.key, MAX_LENGTH_STATE_STATE)
         # Set password mode for sensitive fields
         if description.key in PASSWORD_PARAMS:
             self._attr_mode = "password"
@@ -112,52 +132,17 @@ class FrixosText(FrixosEntity, TextEntity):
     @property
     def native_value(self) -> str | None:
         """Return the current value."""
-        if not self.coordinator.data or not isinstance(self.coordinator.data, dict):
-            return ""
-        
-        settings = self.coordinator.data.get("settings", {})
-        if not isinstance(settings, dict):
-            return ""
-        
-        value = settings.get(self.entity_description.key)
+        value = self._spec.read(self.coordinator.snapshot)
         if value is None:
             return ""
-        
-        value_str = str(value)
-        
-        # Normalize color values when reading
-        if self.entity_description.key in (PARAM_MSG_COLOR, PARAM_NIGHT_MSG_COLOR):
-            value_str = self._normalize_color(value_str)
-        
-        return value_str
-
-    def _normalize_color(self, value: str) -> str:
-        """Normalize hex color value to #RRGGBB format."""
-        if not value:
-            return value
-        
-        # Remove any whitespace
-        value = value.strip()
-        
-        # Remove # if present (we'll add it back)
-        value = value.lstrip("#")
-        
-        # Handle 3-digit hex (e.g., "F00" -> "FF0000")
-        if len(value) == 3:
-            value = "".join(c * 2 for c in value)
-        
-        # Ensure we have 6 hex digits
-        if len(value) == 6 and all(c in "0123456789ABCDEFabcdef" for c in value):
-            return f"#{value.upper()}"
-        
-        # If it doesn't match hex format, return as-is (let device handle validation)
-        return value if value.startswith("#") else f"#{value}"
+        # Longer messages sent by frixos.show_message are shown shortened
+        return value[: self._attr_native_max]
 
     async def async_set_value(self, value: str) -> None:
         """Update the current value."""
         # Normalize color values to standard hex format
         if self.entity_description.key in (PARAM_MSG_COLOR, PARAM_NIGHT_MSG_COLOR):
-            value = self._normalize_color(value)
+            value = normalize_color(value)
         
         success = await self.coordinator.async_set_setting(self.entity_description.key, value)
         if success:
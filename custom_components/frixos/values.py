@@ -0,0 +1,86 @@
+"""Value normalization shared by the Frixos entities and services."""
+from __future__ import annotations
+
+from typing import Any
+
+from .const import COLOR_PARAMS
+
+
+def normalize_color(value: str) -> str:
+    """Normalize hex color value to #RRGGBB format."""
+    if not value:
+        return value
+    
+    # Remove any whitespace
+    value = value.strip()
+    
+    # Remove # if present (we'll add it back)
+    value = value.lstrip("#")
+    
+    # Handle 3-digit hex (e.g., "F00" -> "FF0000")
+    if len(value) == 3:
+        value = "".join(c * 2 for c in value)
+    
+    # Ensure we have 6 hex digits
+    if len(value) == 6 and all(c in "0123456789ABCDEFabcdef" for c in value):
+        return f"#{value.upper()}"
+    
+    # If it doesn't match hex format, return as-is (let device handle validation)
+    return value if value.startswith("#") else f"#{value}"
+
+
+def color_to_rgb(value: Any) -> tuple[int, int, int] | None:
+    """Return the RGB tuple of a device color.
+
+    The firmware reports colors as "#RRGGBB" or "#RGB" strings, [r, g, b]
+    lists or packed 0xRRGGBB integers. Anything else shows as white.
+    """
+    if value is None:
+        return None
+    if isinstance(value, str):
+        digits = normalize_color(value).lstrip("#")
+        if len(digits) == 6:
+            try:
+                return (int(digits[0:2], 16), int(digits[2:4], 16), int(digits[4:6], 16))
+            except ValueError:
+                pass
+    elif isinstance(value, (list, tuple)) and len(value) == 3:
+        try:
+            return (int(value[0]), int(value[1]), int(value[2]))
+        except (ValueError, TypeError):
+            pass
+    elif isinstance(value, int) and not isinstance(value, bool) and 0 <= value <= 0xFFFFFF:
+        return ((value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF)
+    return (255, 255, 255)
+
+
+def values_equal(param: str, current: Any, new: Any) -> bool:
+    """Return True if writing new over current would not change the device.
+
+    Numbers compare by value whatever their type or string form (1, 1.0,
+    "1"), colors ignore case and shorthand, and arrays such as p23
+    compare element by element.
+    """
+    if isinstance(current, (list, tuple)) or isinstance(new, (list, tuple)):
+        return (
+            isinstance(current, (list, tuple))
+            and isinstance(new, (list, tuple))
+            and len(current) == len(new)
+            and all(values_equal(param, a, b) for a, b in zip(current, new))
+        )
+    if current == new:
+        return True
+    if current is None or new is None:
+        return False
+    if param in COLOR_PARAMS and isinstance(current, str) and isinstance(new, str):
+        return normalize_color(current) == normalize_color(new)
+    if isinstance(current, bool) or isinstance(new, bool):
+        # Booleans only match 0/1, which == already covered
+        return False
+    if isinstance(current, str) and isinstance(new, str):
+        # Text such as "01" and "1" differs; only numbers may come as strings
+        return False
+    try:
+        return float(current) == float(new)
+    except (TypeError, ValueError):
+        return False
@@ -0,0 +1,89 @@
+"""Broadcast benchmark: write one setting to N simulated devices at once.
+
+Runs the frixos.set_settings fan-out against --devices simulated devices
+and reports total wall time, how many devices needed a retry and how
+many actually hold the new value. --sequential writes one device at a time for
+comparison with the old one-entity-call-per-device approach.
+
+Usage:
+    python scripts/bench_broadcast.py --devices 100 --latency 0.1 --error-rate 0.05
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+from custom_components.frixos.coordinator import FrixosDataUpdateCoordinator  # noqa: E402
+from custom_components.frixos.services import async_broadcast_settings  # noqa: E402
+from custom_components.frixos.session import async_close_session  # noqa: E402
+
+import simulator  # noqa: E402
+
+
+async def run(args: argparse.Namespace) -> None:
+    """Run the benchmark and print a report."""
+    devices, addresses, runners = await simulator.start_devices(
+        args.devices, latency=args.latency, jitter=args.jitter
+    )
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        coordinators = [FrixosDataUpdateCoordinator(hass, *address) for address in addresses]
+        # Prime the caches the way a running integration would have them
+        await asyncio.gather(*(coordinator.async_refresh() for coordinator in coordinators))
+        for device in devices:
+            device.error_rate = args.error_rate
+
+        started = time.perf_counter()
+        results = await async_broadcast_settings(
+            coordinators,
+            {"p23": [args.brightness, 10]},
+            concurrency=1 if args.sequential else args.concurrency,
+            retry_delay=args.retry_delay,
+        )
+        elapsed = time.perf_counter() - started
+
+        for coordinator in coordinators:
+            await coordinator.async_close()
+        await async_close_session(hass)
+        await hass.async_stop(force=True)
+
+    await simulator.stop_devices(runners)
+
+    succeeded = sum(1 for result in results.values() if result["success"])
+    retried = sum(1 for result in results.values() if result["attempts"] > 1)
+    applied = sum(1 for device in devices if device.settings["p23"][0] == args.brightness)
+    mode = "sequential" if args.sequential else f"concurrency {args.concurrency}"
+    print(f"{args.devices} devices, {mode}, {args.latency * 1000:.0f}ms device latency")
+    print(f"wall time      {elapsed:.2f}s")
+    print(f"succeeded      {succeeded}/{len(results)} ({retried} needed a retry)")
+    print(f"applied        {applied}/{len(devices)} devices hold the new value")
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description="Frixos settings broadcast benchmark.")
+    parser.add_argument("--devices", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--sequential", action="store_true")
+    parser.add_argument("--latency", type=float, default=0.1)
+    parser.add_argument("--jitter", type=float, default=0.02)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--retry-delay", type=float, default=1.0)
+    parser.add_argument("--brightness", type=int, default=42)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.CRITICAL)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
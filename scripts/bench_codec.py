@@ -0,0 +1,85 @@
+"""Micro-benchmark of the Frixos JSON codec against the standard library.
+
+Usage:
+    python scripts/bench_codec.py [--number N] [--fail-below RATIO]
+
+With --fail-below the script exits non-zero if the active codec is not at
+least RATIO times as fast as stdlib json on every payload, so it can guard
+against regressions in CI.
+"""
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import sys
+import timeit
+from pathlib import Path
+
+from sample_payloads import MAX_MESSAGE, SETTINGS, STATUS
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def _load_codec():
+    """Import codec.py directly so Home Assistant is not required."""
+    path = ROOT / "custom_components" / "frixos" / "codec.py"
+    spec = importlib.util.spec_from_file_location("frixos_codec", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def main() -> int:
+    """Run the benchmark and print a table of per-call costs."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20000)
+    parser.add_argument("--fail-below", type=float, default=None)
+    args = parser.parse_args()
+
+    codec = _load_codec()
+    settings_body = json.dumps(SETTINGS).encode()
+    status_body = json.dumps(STATUS).encode()
+    write_payload = {"p16": MAX_MESSAGE, "p12": "#00FF00", "p15": "#0000FF"}
+
+    cases = [
+        (
+            f"decode /api/settings ({len(settings_body)} B)",
+            lambda: json.loads(settings_body),
+            lambda: codec.json_loads(settings_body),
+        ),
+        (
+            f"decode /api/status ({len(status_body)} B)",
+            lambda: json.loads(status_body),
+            lambda: codec.json_loads(status_body),
+        ),
+        (
+            "encode message write (511-char p16)",
+            lambda: json.dumps(write_payload).encode(),
+            lambda: codec.json_dumps(write_payload),
+        ),
+        (
+            "encode full settings",
+            lambda: json.dumps(SETTINGS).encode(),
+            lambda: codec.json_dumps(SETTINGS),
+        ),
+    ]
+
+    print(f"codec: {codec.CODEC_NAME}, {args.number} calls per case")
+    print(f"{'case':<40} {'stdlib us':>10} {'codec us':>10} {'speedup':>8}")
+    worst = float("inf")
+    for name, baseline, candidate in cases:
+        base = min(timeit.repeat(baseline, number=args.number, repeat=3)) / args.number
+        cand = min(timeit.repeat(candidate, number=args.number, repeat=3)) / args.number
+        speedup = base / cand
+        worst = min(worst, speedup)
+        print(f"{name:<40} {base * 1e6:>10.2f} {cand * 1e6:>10.2f} {speedup:>7.2f}x")
+
+    if args.fail_below is not None and worst < args.fail_below:
+        print(f"FAIL: worst speedup {worst:.2f}x is below {args.fail_below:.2f}x")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
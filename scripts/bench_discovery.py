@@ -0,0 +1,83 @@
+"""Discovery scenario: scan a loopback /24 holding simulated Frixos devices.
+
+Starts --devices simulated Frixos devices on 127.0.0.10, 127.0.0.11, ...
+plus one decoy web server whose status does not identify a Frixos, scans
+127.0.0.0/24 with the integration's scanner and checks that exactly the
+Frixos devices were found. Exits non-zero on a mismatch, or if the scan
+took longer than --fail-above seconds.
+
+Usage:
+    python scripts/bench_discovery.py --devices 5 --latency 0.2 --fail-above 5
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import aiohttp
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.frixos.discovery import async_scan_network  # noqa: E402
+
+import simulator  # noqa: E402
+
+
+async def _main(args: argparse.Namespace) -> int:
+    runners = []
+    expected = set()
+    for index in range(args.devices):
+        host = f"127.0.0.{10 + index}"
+        _, addresses, started = await simulator.start_devices(
+            1, host=host, port=args.port, latency=args.latency
+        )
+        runners += started
+        expected.add(f"{addresses[0][0]}:{addresses[0][1]}")
+    _, _, started = await simulator.start_devices(
+        1, host="127.0.0.200", port=args.port, latency=args.latency, app="Other"
+    )
+    runners += started
+
+    try:
+        async with aiohttp.ClientSession() as session:
+            started_at = time.perf_counter()
+            devices = await async_scan_network(
+                session,
+                "127.0.0.0/24",
+                args.port,
+                max_results=args.devices if args.stop_early else None,
+            )
+            elapsed = time.perf_counter() - started_at
+    finally:
+        await simulator.stop_devices(runners)
+
+    found = {device.unique_id for device in devices}
+    print(f"scanned 254 addresses in {elapsed:.2f}s, found {len(found)}/{len(expected)}")
+    for device in devices:
+        print(f"  {device!r}")
+
+    if found != expected:
+        print(f"FAIL: missing {sorted(expected - found)}, unexpected {sorted(found - expected)}")
+        return 1
+    if args.fail_above is not None and elapsed > args.fail_above:
+        print(f"FAIL: scan took longer than {args.fail_above}s")
+        return 1
+    return 0
+
+
+def main() -> int:
+    """Parse arguments and run the scenario."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--devices", type=int, default=5)
+    parser.add_argument("--port", type=int, default=18080)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--stop-early", action="store_true", help="stop once all devices are found")
+    parser.add_argument("--fail-above", type=float, default=None)
+    return asyncio.run(_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,158 @@
+"""Micro-benchmark of entity property reads across all Frixos platforms.
+
+Measures the cost of one state read (the property Home Assistant calls
+when writing entity state) per platform, and of device_info, against a
+realistic poll, plus the per-poll cost of converting every value into the
+coordinator snapshot. Also reports the memory one device's coordinator
+data and entities take once every entity has been read.
+
+Usage:
+    python scripts/bench_entities.py [--number N] [--devices N]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import sys
+import tempfile
+import timeit
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+from custom_components.frixos import number, select, sensor, switch, text  # noqa: E402
+from custom_components.frixos.coordinator import FrixosDataUpdateCoordinator  # noqa: E402
+from custom_components.frixos.snapshot import FrixosSnapshot  # noqa: E402
+
+import sample_payloads  # noqa: E402
+
+# Property read by Home Assistant for each platform's state
+PLATFORMS = {
+    "sensor": (sensor.FrixosSensor, sensor.SENSOR_DESCRIPTIONS, "native_value"),
+    "switch": (switch.FrixosSwitch, switch.SWITCH_DESCRIPTIONS, "is_on"),
+    "number": (number.FrixosNumber, number.NUMBER_DESCRIPTIONS, "native_value"),
+    "select": (select.FrixosSelect, select.SELECT_DESCRIPTIONS, "current_option"),
+    "text": (text.FrixosText, text.TEXT_DESCRIPTIONS, "native_value"),
+}
+
+
+def make_coordinator(hass: HomeAssistant, index: int = 0) -> FrixosDataUpdateCoordinator:
+    """Return a coordinator holding one poll's data."""
+    coordinator = FrixosDataUpdateCoordinator(hass, f"10.0.{index // 256}.{index % 256}", 80)
+    coordinator.async_set_updated_data(
+        {"settings": sample_payloads.settings(), "status": sample_payloads.status()}
+    )
+    return coordinator
+
+
+def make_entity(entity_class: type, coordinator: FrixosDataUpdateCoordinator, description):
+    """Return an entity whose value the coordinator converts, as once added."""
+    entity = entity_class(coordinator, description)
+    if entity._spec is not None:
+        coordinator.async_track_spec(entity._spec)
+    return entity
+
+
+def make_entities(coordinator: FrixosDataUpdateCoordinator) -> list:
+    """Return one entity per description, each read once."""
+    entities = [
+        make_entity(entity_class, coordinator, description)
+        for entity_class, descriptions, _ in PLATFORMS.values()
+        for description in descriptions
+    ]
+    for entity_class, descriptions, prop in PLATFORMS.values():
+        for entity in entities:
+            if isinstance(entity, entity_class):
+                getattr(entity, prop)
+    return entities
+
+
+def measure_reads(hass: HomeAssistant, number_: int) -> None:
+    """Print the cost of one property read per platform."""
+    coordinator = make_coordinator(hass)
+    print(f"{'platform':<12} {'entities':>8} {'ns/read':>10}")
+    total_reads = total_time = 0.0
+    rows = {
+        name: (entity_class, descriptions, getattr(entity_class, prop).fget)
+        for name, (entity_class, descriptions, prop) in PLATFORMS.items()
+    }
+    rows["device_info"] = (
+        switch.FrixosSwitch,
+        switch.SWITCH_DESCRIPTIONS,
+        switch.FrixosSwitch.device_info.fget,
+    )
+    for name, (entity_class, descriptions, getter) in rows.items():
+        entities = [
+            make_entity(entity_class, coordinator, description) for description in descriptions
+        ]
+
+        def read_all(entities=entities, getter=getter) -> None:
+            for entity in entities:
+                getter(entity)
+
+        elapsed = min(timeit.repeat(read_all, number=number_, repeat=3))
+        reads = number_ * len(entities)
+        if name in PLATFORMS:
+            total_reads += reads
+            total_time += elapsed
+        print(f"{name:<12} {len(entities):>8} {elapsed / reads * 1e9:>10.0f}")
+    print(f"{'all states':<12} {'':>8} {total_time / total_reads * 1e9:>10.0f}")
+
+    # Paid once per poll that changed the data, instead of on every read
+    coordinator = make_coordinator(hass, 1)
+    make_entities(coordinator)
+    specs = coordinator._specs
+    builds = {
+        "snapshot": lambda: FrixosSnapshot(coordinator.data, specs),
+        "lux changed": lambda: FrixosSnapshot(
+            coordinator.data, specs, coordinator.snapshot, {"lux"}
+        ),
+    }
+    for name, build in builds.items():
+        elapsed = min(timeit.repeat(build, number=number_ // 10, repeat=3))
+        print(f"{name:<12} {len(coordinator.snapshot.values):>8} {elapsed / (number_ // 10) * 1e9:>10.0f} ns/build")
+    coordinator._async_unsub_refresh()
+
+
+def measure_memory(hass: HomeAssistant, devices: int) -> None:
+    """Print the memory per device of coordinator data plus entities."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    held = []
+    for index in range(devices):
+        coordinator = make_coordinator(hass, index)
+        held.append((coordinator, make_entities(coordinator)))
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    entities = len(held[0][1])
+    print(f"memory       {(after - before) / devices / 1024:.1f} KiB per device "
+          f"({devices} devices, {entities} entities each)")
+    for coordinator, _ in held:
+        coordinator._async_unsub_refresh()
+
+
+async def run(args: argparse.Namespace) -> None:
+    """Run the benchmark and print a report."""
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        measure_reads(hass, args.number)
+        measure_memory(hass, args.devices)
+        await hass.async_stop(force=True)
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20000)
+    parser.add_argument("--devices", type=int, default=100)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
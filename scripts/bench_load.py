@@ -0,0 +1,344 @@
+"""Load benchmark: N Frixos coordinators polling M simulated devices.
+
+Reports polls/s, p50/p95/p99 poll and write latency, event-loop lag and
+memory. Simulated devices run in-process, each on its own loopback
+address, unless --target points at devices started separately with
+scripts/simulator.py.
+
+--mode picks how polls are timed: "random" polls every coordinator at a
+fixed rate from a random offset, "lockstep" starts them all at once like
+a restart without the fleet scheduler, and "scheduler" lets each
+coordinator poll itself on the fleet scheduler's slots after a
+simultaneous first refresh. The peak polls started per twentieth of the
+interval and the peak polls queued or running show how flat the load is.
+
+--session per-request opens a new HTTP session for every request instead
+of using the shared keep-alive connection pool; with in-process devices
+the TCP connections they accepted are reported for comparison.
+
+Usage:
+    python scripts/bench_load.py --coordinators 100 --devices 100 --duration 30
+    python scripts/bench_load.py --coordinators 300 --devices 300 --interval 5 --mode scheduler
+    python scripts/bench_load.py --devices 50 --coordinators 50 --session per-request
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import random
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import aiohttp  # noqa: E402
+from homeassistant.core import HomeAssistant  # noqa: E402
+from homeassistant.helpers.update_coordinator import UpdateFailed  # noqa: E402
+
+from custom_components.frixos.const import (  # noqa: E402
+    CONF_MAX_INTERVAL,
+    CONF_MIN_INTERVAL,
+    CONF_STATUS_INTERVAL,
+)
+from custom_components.frixos.coordinator import FrixosDataUpdateCoordinator  # noqa: E402
+from custom_components.frixos.session import async_close_session  # noqa: E402
+
+import simulator  # noqa: E402
+
+# Share of the poll interval over which poll starts are counted for peaks
+PEAK_SLICES = 20
+
+
+class BenchCoordinator(FrixosDataUpdateCoordinator):
+    """Coordinator recording when its polls start and how many run at once."""
+
+    starts: list[float] = []
+    latencies: list[float] = []
+    failures = 0
+    in_flight = 0
+    peak_in_flight = 0
+
+    async def _async_update_data(self) -> dict:
+        cls = BenchCoordinator
+        start = time.perf_counter()
+        cls.starts.append(start)
+        cls.in_flight += 1
+        cls.peak_in_flight = max(cls.peak_in_flight, cls.in_flight)
+        try:
+            return await super()._async_update_data()
+        except UpdateFailed:
+            cls.failures += 1
+            raise
+        finally:
+            cls.in_flight -= 1
+            cls.latencies.append(time.perf_counter() - start)
+
+    @classmethod
+    def reset(cls) -> None:
+        """Forget what was recorded so far."""
+        cls.starts, cls.latencies = [], []
+        cls.failures = cls.peak_in_flight = 0
+
+
+class PerRequestSessionCoordinator(BenchCoordinator):
+    """Coordinator opening a new HTTP session, and connection, per request."""
+
+    async def _async_get_endpoint(self, endpoint: str, label: str, timeout: float) -> dict:
+        async with aiohttp.ClientSession() as self._session:
+            return await super()._async_get_endpoint(endpoint, label, timeout)
+
+    async def _async_post_settings(self, payload: dict) -> bool:
+        async with aiohttp.ClientSession() as self._session:
+            return await super()._async_post_settings(payload)
+
+
+def peak_starts(starts: list[float], started: float, width: float) -> tuple[int, float]:
+    """Return the most poll starts in one slice of width seconds, and the mean."""
+    counts: dict[int, int] = {}
+    for start in starts:
+        if start >= started:
+            index = int((start - started) // width)
+            counts[index] = counts.get(index, 0) + 1
+    slices = max(counts, default=0) + 1
+    return max(counts.values(), default=0), len(starts) / slices
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Return the pct percentile of samples (nearest rank)."""
+    if not samples:
+        return float("nan")
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def describe(name: str, samples: list[float]) -> str:
+    """Format latency percentiles in milliseconds."""
+    return (
+        f"{name:<14} n={len(samples):<7} "
+        f"p50={percentile(samples, 50) * 1000:8.1f}ms "
+        f"p95={percentile(samples, 95) * 1000:8.1f}ms "
+        f"p99={percentile(samples, 99) * 1000:8.1f}ms"
+    )
+
+
+async def _measure_loop_lag(stop: asyncio.Event, samples: list[float], tick: float = 0.05) -> None:
+    """Record how late the event loop wakes up from a fixed sleep."""
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        start = loop.time()
+        await asyncio.sleep(tick)
+        samples.append(max(0.0, loop.time() - start - tick))
+
+
+async def _poll_worker(
+    coordinator: FrixosDataUpdateCoordinator,
+    interval: float,
+    offset: float,
+    stop: asyncio.Event,
+    latencies: list[float],
+    failures: list[int],
+) -> None:
+    """Poll one coordinator at a fixed rate, starting after offset seconds."""
+    await asyncio.sleep(offset)
+    while not stop.is_set():
+        start = time.perf_counter()
+        await coordinator.async_refresh()
+        latencies.append(time.perf_counter() - start)
+        if not coordinator.last_update_success:
+            failures[0] += 1
+        await asyncio.sleep(max(0.0, interval - latencies[-1]))
+
+
+async def _write_worker(
+    coordinators: list[FrixosDataUpdateCoordinator],
+    rate: float,
+    stop: asyncio.Event,
+    latencies: list[float],
+    failures: list[int],
+) -> None:
+    """Issue brightness writes to random coordinators at rate writes/s."""
+
+    async def _write(coordinator: FrixosDataUpdateCoordinator) -> None:
+        start = time.perf_counter()
+        ok = await coordinator.async_set_setting("p23", [random.randint(1, 100), 20])
+        latencies.append(time.perf_counter() - start)
+        if not ok:
+            failures[0] += 1
+
+    tasks = set()
+    while not stop.is_set():
+        task = asyncio.create_task(_write(random.choice(coordinators)))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+        await asyncio.sleep(1 / rate)
+    if tasks:
+        await asyncio.gather(*tasks)
+
+
+async def run(args: argparse.Namespace) -> None:
+    """Run the benchmark and print a report."""
+    if args.tracemalloc:
+        tracemalloc.start()
+
+    runners = []
+    devices = []
+    if args.target:
+        addresses = [
+            (host, int(port))
+            for host, port in (item.rsplit(":", 1) for item in args.target.split(","))
+        ]
+    else:
+        # Distinct hosts, as on a real network, so each gets its own poll slot
+        addresses = []
+        for index in range(args.devices):
+            started_devices, device_addresses, device_runners = await simulator.start_devices(
+                1,
+                host=f"127.0.{index // 250}.{index % 250 + 2}",
+                latency=args.latency,
+                jitter=args.jitter,
+                error_rate=args.error_rate,
+                reboot_every=args.reboot_every,
+            )
+            devices.extend(started_devices)
+            addresses.extend(device_addresses)
+            runners.extend(device_runners)
+
+    # A fixed poll interval, so the modes differ only in when polls happen
+    options = {
+        CONF_STATUS_INTERVAL: args.interval,
+        CONF_MIN_INTERVAL: args.interval,
+        CONF_MAX_INTERVAL: args.interval,
+    }
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        coordinator_class = (
+            PerRequestSessionCoordinator if args.session == "per-request" else BenchCoordinator
+        )
+        coordinators = [
+            coordinator_class(hass, *addresses[index % len(addresses)], options)
+            for index in range(args.coordinators)
+        ]
+
+        stop = asyncio.Event()
+        poll_latency: list[float] = []
+        write_latency: list[float] = []
+        loop_lag: list[float] = []
+        poll_failures = [0]
+        write_failures = [0]
+
+        unsubs = []
+        if args.mode == "scheduler":
+            # Like a restart: every device refreshed at once, then on its slot
+            await asyncio.gather(*(coordinator.async_refresh() for coordinator in coordinators))
+            unsubs = [coordinator.async_add_listener(lambda: None) for coordinator in coordinators]
+        BenchCoordinator.reset()
+        connections = sum(device.connections for device in devices)
+        requests = sum(sum(device.requests.values()) for device in devices)
+
+        tasks = [asyncio.create_task(_measure_loop_lag(stop, loop_lag))]
+        if args.mode != "scheduler":
+            tasks.extend(
+                asyncio.create_task(
+                    _poll_worker(
+                        coordinator,
+                        args.interval,
+                        0.0 if args.mode == "lockstep" else random.uniform(0, args.interval),
+                        stop,
+                        poll_latency,
+                        poll_failures,
+                    )
+                )
+                for coordinator in coordinators
+            )
+        if args.write_rate > 0:
+            tasks.append(
+                asyncio.create_task(
+                    _write_worker(coordinators, args.write_rate, stop, write_latency, write_failures)
+                )
+            )
+
+        started = time.perf_counter()
+        await asyncio.sleep(args.duration)
+        stop.set()
+        await asyncio.gather(*tasks)
+        elapsed = time.perf_counter() - started
+        for unsub in unsubs:
+            unsub()
+        if args.mode == "scheduler":
+            poll_latency = BenchCoordinator.latencies
+            poll_failures[0] = BenchCoordinator.failures
+        connections = sum(device.connections for device in devices) - connections
+        requests = sum(sum(device.requests.values()) for device in devices) - requests
+        peak, mean = peak_starts(
+            BenchCoordinator.starts, started, args.interval / PEAK_SLICES
+        )
+
+        for coordinator in coordinators:
+            await coordinator.async_close()
+        await async_close_session(hass)
+        await hass.async_stop(force=True)
+
+    await simulator.stop_devices(runners)
+
+    print(
+        f"{args.coordinators} coordinators, {len(addresses)} devices, "
+        f"{args.interval}s poll interval, {args.mode} polls, "
+        f"{args.session} session, {elapsed:.1f}s"
+    )
+    print(f"polls/s        {len(poll_latency) / elapsed:.1f} ({poll_failures[0]} failed)")
+    print(
+        f"peak polls     {peak} started per {args.interval / PEAK_SLICES:g}s "
+        f"(mean {mean:.1f}), {BenchCoordinator.peak_in_flight} queued or running"
+    )
+    print(describe("poll latency", poll_latency))
+    if devices:
+        print(f"connections    {connections} opened for {requests} requests")
+    if args.write_rate > 0:
+        print(f"writes/s       {len(write_latency) / elapsed:.1f} ({write_failures[0]} failed)")
+        print(describe("write latency", write_latency))
+    print(describe("loop lag", loop_lag) + f" max={max(loop_lag, default=0) * 1000:.1f}ms")
+    print(f"max RSS        {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.1f} MiB")
+    if args.tracemalloc:
+        current, peak = tracemalloc.get_traced_memory()
+        print(f"python heap    current={current / 2**20:.1f} MiB peak={peak / 2**20:.1f} MiB")
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description="Frixos coordinator load benchmark.")
+    parser.add_argument("--coordinators", type=int, default=10)
+    parser.add_argument("--devices", type=int, default=10, help="simulated devices to start")
+    parser.add_argument("--target", help="host:port,... of already running devices")
+    parser.add_argument("--duration", type=float, default=20.0, help="seconds")
+    parser.add_argument("--interval", type=float, default=1.0, help="poll interval per coordinator")
+    parser.add_argument(
+        "--mode",
+        choices=("random", "lockstep", "scheduler"),
+        default="random",
+        help="how polls are timed",
+    )
+    parser.add_argument(
+        "--session",
+        choices=("shared", "per-request"),
+        default="shared",
+        help="shared connection pool or a new session per request",
+    )
+    parser.add_argument("--write-rate", type=float, default=0.0, help="writes/s across all devices")
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--jitter", type=float, default=0.01)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--reboot-every", type=float, default=None)
+    parser.add_argument("--tracemalloc", action="store_true", help="also report Python heap")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.CRITICAL)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
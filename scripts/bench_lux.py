@@ -0,0 +1,94 @@
+"""Light level sampler benchmark: cost per sample and memory per device.
+
+Feeds synthetic light levels through the lux sampler's ring buffer and
+rolling windows and reports the cost of one sample for growing window
+lengths (it should stay flat, every statistic is updated in O(1)), next
+to recomputing the same statistics from a list, plus the sampler's
+memory with the given interval and windows.
+
+Usage:
+    python scripts/bench_lux.py [--interval 2] [--windows 60 300 900]
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.frixos.sampler import (  # noqa: E402
+    FrixosLuxSampler,
+    RollingWindow,
+    SampleBuffer,
+)
+
+LENGTHS = (30, 150, 450, 1800)
+
+
+def measure_window(length: int, samples: int) -> tuple[float, float]:
+    """Return ns per sample for the rolling window and for recomputing a list."""
+    values = [random.uniform(0, 1000) for _ in range(samples)]
+    buffer = SampleBuffer(length + 1)
+    window = RollingWindow(length, buffer)
+    started = time.perf_counter()
+    for value in values:
+        window.add(buffer.append(value))
+        window.mean, window.minimum, window.maximum, window.slope
+    rolling = (time.perf_counter() - started) / samples * 1e9
+
+    # Recomputing from the latest samples, as a naive sampler would
+    naive_samples = min(samples, 2000)
+    history: list[float] = []
+    positions = list(range(length))
+    started = time.perf_counter()
+    for value in values[:naive_samples]:
+        history.append(value)
+        del history[:-length]
+        statistics.fmean(history), min(history), max(history)
+        if len(history) >= 2:
+            statistics.linear_regression(positions[: len(history)], history)
+    naive = (time.perf_counter() - started) / naive_samples * 1e9
+    return rolling, naive
+
+
+def measure_memory(interval: float, windows: list[int], devices: int) -> float:
+    """Return the memory of one device's sampler in KiB."""
+    coordinator = SimpleNamespace(hass=None, host="bench")
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    samplers = [FrixosLuxSampler(coordinator, interval, windows) for _ in range(devices)]
+    for sampler in samplers:
+        for _ in range(max(windows) // int(interval) * 2):
+            sampler.add(random.uniform(0, 1000))
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / devices / 1024
+
+
+def main() -> None:
+    """Run the benchmark and print a report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--samples", type=int, default=20000)
+    parser.add_argument("--interval", type=float, default=2)
+    parser.add_argument("--windows", type=int, nargs="+", default=[60, 300, 900])
+    parser.add_argument("--devices", type=int, default=100)
+    args = parser.parse_args()
+
+    random.seed(1)
+    print(f"{'window':>8} {'rolling ns':>12} {'recompute ns':>14}")
+    for length in LENGTHS:
+        rolling, naive = measure_window(length, args.samples)
+        print(f"{length:>8} {rolling:>12.0f} {naive:>14.0f}")
+    memory = measure_memory(args.interval, args.windows, args.devices)
+    windows = ", ".join(str(window) for window in args.windows)
+    print(f"memory   {memory:.1f} KiB per device ({args.interval:g}s samples, windows {windows}s)")
+
+
+if __name__ == "__main__":
+    main()
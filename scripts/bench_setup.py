@@ -0,0 +1,142 @@
+"""Setup benchmark: config entry setup time and entity registry size per device.
+
+Starts --devices simulated devices, each on its own loopback address so
+their entities do not collide, sets up one config entry per device in a
+bare Home Assistant instance and reports the setup wall time, the
+platforms loaded and the entities registered per device. --omit removes
+parameters from the simulated settings, like older firmware would.
+
+Usage:
+    python scripts/bench_setup.py --devices 20
+    python scripts/bench_setup.py --devices 20 --omit p29 p30 p31 p32 p33
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from homeassistant import config_entries, loader  # noqa: E402
+from homeassistant.components import network  # noqa: E402
+from homeassistant.const import CONF_HOST, CONF_NAME, CONF_PORT  # noqa: E402
+from homeassistant.core import HomeAssistant  # noqa: E402
+from homeassistant.helpers import (  # noqa: E402
+    area_registry as ar,
+    device_registry as dr,
+    entity as entity_helper,
+    entity_registry as er,
+)
+
+import simulator  # noqa: E402
+
+DOMAIN = "frixos"
+
+
+async def _async_source_ip(hass: HomeAssistant, target_ip: str | None = None) -> str:
+    """Return the loopback address instead of probing the network."""
+    return "127.0.0.1"
+
+
+async def async_start_hass(config_dir: str) -> HomeAssistant:
+    """Return a started Home Assistant instance that can load the integration."""
+    os.symlink(ROOT / "custom_components", Path(config_dir) / "custom_components")
+    hass = HomeAssistant(config_dir)
+    loader.async_setup(hass)
+    entity_helper.async_setup(hass)
+    await ar.async_load(hass)
+    await dr.async_load(hass)
+    await er.async_load(hass)
+    hass.config_entries = config_entries.ConfigEntries(hass, {})
+    await hass.config_entries.async_initialize()
+    # Dependencies of the integration that need a full install to set up
+    hass.config.components.update({"network", "http", "websocket_api"})
+    network.async_get_source_ip = _async_source_ip
+    await hass.async_start()
+    return hass
+
+
+async def run(args: argparse.Namespace) -> None:
+    """Run the benchmark and print a report."""
+    runners = []
+    addresses = []
+    for index in range(args.devices):
+        _, device_addresses, device_runners = await simulator.start_devices(
+            1, host=f"127.0.0.{index + 2}", latency=args.latency, omit=tuple(args.omit)
+        )
+        addresses.extend(device_addresses)
+        runners.extend(device_runners)
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = await async_start_hass(config_dir)
+        entries = [
+            config_entries.ConfigEntry(
+                version=1,
+                minor_version=1,
+                domain=DOMAIN,
+                title=f"Frixos {host}",
+                data={CONF_HOST: host, CONF_PORT: port, CONF_NAME: f"Frixos {host}"},
+                source=config_entries.SOURCE_USER,
+                unique_id=f"{host}:{port}",
+            )
+            for host, port in addresses
+        ]
+
+        started = time.perf_counter()
+        for entry in entries:
+            await hass.config_entries.async_add(entry)
+        await hass.async_block_till_done()
+        elapsed = time.perf_counter() - started
+
+        loaded = sum(
+            1 for entry in entries if entry.state is config_entries.ConfigEntryState.LOADED
+        )
+        registry = er.async_get(hass)
+        registered = [
+            entity for entity in registry.entities.values() if entity.platform == DOMAIN
+        ]
+        platforms = sorted({entity.domain for entity in registered})
+        enabled = sum(1 for entity in registered if not entity.disabled)
+        states = sum(
+            1
+            for state in hass.states.async_all()
+            if state.entity_id in {entity.entity_id for entity in registered}
+        )
+
+        await hass.async_stop(force=True)
+
+    await simulator.stop_devices(runners)
+
+    per_device = 1000 * elapsed / args.devices
+    print(f"{args.devices} devices, {args.latency * 1000:.0f}ms device latency")
+    if args.omit:
+        print(f"omitted        {' '.join(args.omit)}")
+    print(f"loaded         {loaded}/{len(entries)} entries")
+    print(f"setup time     {elapsed:.2f}s ({per_device:.1f}ms per device)")
+    print(f"platforms      {', '.join(platforms)}")
+    print(f"registered     {len(registered) / args.devices:.1f} entities per device")
+    print(f"enabled        {enabled / args.devices:.1f} entities per device")
+    print(f"states         {states / args.devices:.1f} per device")
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description="Frixos config entry setup benchmark.")
+    parser.add_argument("--devices", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--omit", nargs="*", default=[], help="parameters the firmware lacks")
+    parser.add_argument("--debug", action="store_true")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.DEBUG if args.debug else logging.WARNING)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
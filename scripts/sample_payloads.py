@@ -0,0 +1,81 @@
+"""Realistic Frixos API payloads for the simulator and benchmarks."""
+from __future__ import annotations
+
+import copy
+from typing import Any
+
+# Longest message the firmware accepts (p16 is limited to 511 characters)
+MAX_MESSAGE = (
+    "Welcome to the lobby! Today: [temp] and [HA:weather.home:state]. "
+    * 8
+)[:511]
+
+SETTINGS: dict[str, Any] = {
+    "p00": "frixos",
+    "p01": 0,
+    "p02": 0,
+    "p03": 0,
+    "p04": "bold",
+    "p05": "light",
+    "p06": 1,
+    "p07": 1,
+    "p08": 0,
+    "p09": 0,
+    "p10": 0,
+    "p11": 1,
+    "p12": "#FFFFFF",
+    "p13": 1,
+    "p14": 60,
+    "p15": "#FF0000",
+    "p16": MAX_MESSAGE,
+    "p17": "37.9838",
+    "p18": "23.7275",
+    "p19": "EET-2EEST,M3.5.0/3,M10.5.0/4",
+    "p20": 5.0,
+    "p21": 40.0,
+    "p22": 0,
+    "p23": [80, 20],
+    "p24": 1,
+    "p25": "http://homeassistant.local:8123",
+    "p26": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9." + "x" * 140,
+    "p27": 5,
+    "p28": "",
+    "p29": 60,
+    "p30": 0,
+    "p31": "",
+    "p32": "",
+    "p33": 5,
+    "p34": "MyWiFi",
+    "p35": "wifi-password",
+    "p36": 0,
+    "p37": 0,
+    "p38": 3,
+    "p39": 1,
+    "p40": 0,
+    "p41": 0,
+    "p42": 500,
+    "p43": 1023,
+}
+
+STATUS: dict[str, Any] = {
+    "app": "Frixos",
+    "version": "1.4.2",
+    "lux": 123.4,
+    "uptime": 3600,
+    "free_heap": 123456,
+    "min_free_heap": 100000,
+}
+
+
+def settings(**overrides: Any) -> dict[str, Any]:
+    """Return a fresh copy of the sample settings with overrides applied."""
+    data = copy.deepcopy(SETTINGS)
+    data.update(overrides)
+    return data
+
+
+def status(**overrides: Any) -> dict[str, Any]:
+    """Return a fresh copy of the sample status with overrides applied."""
+    data = dict(STATUS)
+    data.update(overrides)
+    return data
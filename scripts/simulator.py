@@ -0,0 +1,201 @@
+"""Local stand-in for Frixos devices, for development and load benchmarks.
+
+Each simulated device serves GET/POST /api/settings and GET /api/status
+with the real p00-p43 schema. Like the ESP firmware it handles one
+request at a time, and it can add latency, fail a share of requests and
+reboot periodically.
+
+Usage:
+    python scripts/simulator.py --devices 3 --port 8080 --latency 0.05
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import time
+import weakref
+from typing import Any
+
+from aiohttp import web
+
+import sample_payloads
+
+# Writing these makes the real device restart
+RESTART_PARAMS = {"p00", "p17", "p18", "p19", "p34", "p35"}
+
+
+class SimulatedFrixos:
+    """One simulated Frixos device."""
+
+    def __init__(
+        self,
+        name: str = "frixos",
+        latency: float = 0.02,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        reboot_every: float | None = None,
+        reboot_duration: float = 5.0,
+        app: str = "Frixos",
+        omit: tuple[str, ...] = (),
+        seed: int | None = None,
+    ) -> None:
+        """Initialize the device state.
+
+        omit lists parameters left out of the settings, like older firmware.
+        """
+        self.settings = sample_payloads.settings(p00=name)
+        for param in omit:
+            self.settings.pop(param, None)
+        self.app = app
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.reboot_every = reboot_every
+        self.reboot_duration = reboot_duration
+        self.requests: dict[str, int] = {"GET settings": 0, "POST settings": 0, "GET status": 0}
+        self.errors = 0
+        # TCP connections accepted, to see whether clients reuse them
+        self.connections = 0
+        self._transports: weakref.WeakSet = weakref.WeakSet()
+        self._random = random.Random(seed)
+        self._lux = 120.0
+        self._booted_at = time.monotonic()
+        self._down_until = 0.0
+        # The ESP web server handles a single connection at a time
+        self._lock = asyncio.Lock()
+
+    def reboot(self, duration: float | None = None) -> None:
+        """Drop all requests for a while, then come back with a fresh uptime."""
+        now = time.monotonic()
+        self._down_until = now + (self.reboot_duration if duration is None else duration)
+        self._booted_at = self._down_until
+
+    def status(self) -> dict[str, Any]:
+        """Return the current /api/status payload."""
+        self._lux = max(0.0, self._lux + self._random.uniform(-2.0, 2.0))
+        return sample_payloads.status(
+            app=self.app,
+            lux=round(self._lux, 1),
+            uptime=int(time.monotonic() - self._booted_at),
+            free_heap=120000 + self._random.randrange(8000),
+        )
+
+    def make_app(self) -> web.Application:
+        """Return the aiohttp application serving this device."""
+        app = web.Application()
+        app.router.add_get("/api/settings", self._get_settings)
+        app.router.add_post("/api/settings", self._post_settings)
+        app.router.add_get("/api/status", self._get_status)
+        return app
+
+    async def _serve(self, request: web.Request, label: str) -> None:
+        """Apply the single-connection limit, latency, errors and reboots."""
+        self.requests[label] += 1
+        if request.transport is not None and request.transport not in self._transports:
+            self._transports.add(request.transport)
+            self.connections += 1
+        now = time.monotonic()
+        if self.reboot_every and now - self._booted_at >= self.reboot_every:
+            self.reboot()
+        if now < self._down_until:
+            # A rebooting device simply drops the connection
+            request.transport.close()
+            raise web.HTTPServiceUnavailable()
+        async with self._lock:
+            delay = self.latency + self._random.uniform(0, self.jitter)
+            if delay:
+                await asyncio.sleep(delay)
+        if self.error_rate and self._random.random() < self.error_rate:
+            self.errors += 1
+            raise web.HTTPInternalServerError(text="simulated error")
+
+    async def _get_settings(self, request: web.Request) -> web.Response:
+        await self._serve(request, "GET settings")
+        return web.json_response(self.settings)
+
+    async def _get_status(self, request: web.Request) -> web.Response:
+        await self._serve(request, "GET status")
+        return web.json_response(self.status())
+
+    async def _post_settings(self, request: web.Request) -> web.Response:
+        await self._serve(request, "POST settings")
+        try:
+            payload = json.loads(await request.read())
+        except ValueError:
+            return web.json_response({"status": "error", "error": "invalid json"}, status=400)
+        if not isinstance(payload, dict):
+            return web.json_response({"status": "error", "error": "expected object"}, status=400)
+        unknown = [key for key in payload if key not in self.settings]
+        if unknown:
+            return web.json_response({"status": "error", "error": f"unknown {unknown}"}, status=400)
+        if isinstance(payload.get("p16"), str) and len(payload["p16"]) > 511:
+            return web.json_response({"status": "error", "error": "p16 too long"}, status=400)
+        self.settings.update(payload)
+        if RESTART_PARAMS.intersection(payload):
+            asyncio.get_running_loop().call_later(0.1, self.reboot)
+        return web.json_response({"status": "ok"})
+
+
+async def start_devices(
+    count: int, host: str = "127.0.0.1", port: int = 0, **kwargs: Any
+) -> tuple[list[SimulatedFrixos], list[tuple[str, int]], list[web.AppRunner]]:
+    """Start count simulated devices on consecutive ports (or random ones if port is 0)."""
+    devices, addresses, runners = [], [], []
+    for index in range(count):
+        device = SimulatedFrixos(name=f"frixos-{index}", seed=index, **kwargs)
+        runner = web.AppRunner(device.make_app(), access_log=None)
+        await runner.setup()
+        site = web.TCPSite(runner, host, port + index if port else 0)
+        await site.start()
+        bound_host, bound_port = runner.addresses[0][:2]
+        devices.append(device)
+        addresses.append((bound_host, bound_port))
+        runners.append(runner)
+    return devices, addresses, runners
+
+
+async def stop_devices(runners: list[web.AppRunner]) -> None:
+    """Stop simulated devices started by start_devices."""
+    await asyncio.gather(*(runner.cleanup() for runner in runners))
+
+
+async def _main(args: argparse.Namespace) -> None:
+    devices, addresses, runners = await start_devices(
+        args.devices,
+        host=args.host,
+        port=args.port,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        reboot_every=args.reboot_every,
+        reboot_duration=args.reboot_duration,
+    )
+    for device, (host, port) in zip(devices, addresses):
+        print(f"{device.settings['p00']}: http://{host}:{port}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await stop_devices(runners)
+
+
+def main() -> None:
+    """Run simulated devices until interrupted."""
+    parser = argparse.ArgumentParser(description="Run simulated Frixos devices.")
+    parser.add_argument("--devices", type=int, default=1)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080, help="first port, 0 for random")
+    parser.add_argument("--latency", type=float, default=0.02, help="seconds per request")
+    parser.add_argument("--jitter", type=float, default=0.0, help="extra random latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of HTTP 500s")
+    parser.add_argument("--reboot-every", type=float, default=None, help="seconds between reboots")
+    parser.add_argument("--reboot-duration", type=float, default=5.0)
+    try:
+        asyncio.run(_main(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()